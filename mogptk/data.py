@@ -1,5 +1,6 @@
 import re
 import copy
+import functools
 import inspect
 import datetime
 import logging
@@ -8,8 +9,6 @@ import collections
 import torch
 import numpy as np
 import pandas as pd
-from scipy import signal
-import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from pandas.plotting import register_matplotlib_converters
@@ -258,7 +257,7 @@ class Data:
         self.Y = Y # shape (n)
         self.Y_err = Y_err # shape (n) or None
         self.X_pred = None
-        self.mask = np.array([True] * Y.shape[0])
+        self.mask = np.ones(Y.shape[0], dtype=bool)
         self.F = None
 
         self.X_dtypes = X_dtypes
@@ -291,24 +290,27 @@ class Data:
                 m = len(X[0])
                 if not all(len(x) == m for x in X[1:]):
                     raise ValueError("X list items must all be lists of the same length")
-                if not all(all(isinstance(val, (int, float, datetime.datetime, np.datetime64)) for val in x) for x in X):
+                types = [_get_types(x) for x in X]
+                if not all(_is_subclass_types(x_types, (int, float, datetime.datetime, np.datetime64)) for x_types in types):
                     raise ValueError("X list items must all be lists of numbers or datetime")
-                if not all(_is_homogeneous_type(x) for x in X):
+                if not all(len(x_types) <= 1 for x_types in types):
                     raise ValueError("X list items must all be lists with elements of the same type")
             elif all(isinstance(x, np.ndarray) for x in X):
                 islist = True
                 m = len(X[0])
                 if not all(len(x) == m for x in X[1:]):
                     raise ValueError("X list items must all be numpy.ndarrays of the same length")
-            elif not all(isinstance(x, (int, float, datetime.datetime, np.datetime64)) for x in X):
-                raise ValueError("X list items must be all lists, all numpy.ndarrays, or all numbers or datetime")
-            elif not _is_homogeneous_type(X):
-                raise ValueError("X list items must all have elements of the same type")
+            else:
+                types = _get_types(X)
+                if not _is_subclass_types(types, (int, float, datetime.datetime, np.datetime64)):
+                    raise ValueError("X list items must be all lists, all numpy.ndarrays, or all numbers or datetime")
+                elif 1 < len(types):
+                    raise ValueError("X list items must all have elements of the same type")
 
             if islist:
-                X = [np.array(x) for x in X]
+                X = [np.asarray(x) for x in X]
             else:
-                X = [np.array(X)]
+                X = [np.asarray(X)]
         elif isinstance(X, (np.ndarray, pd.Series, torch.Tensor)):
             if isinstance(X, pd.Series):
                 X = X.to_numpy()
@@ -318,6 +320,9 @@ class Data:
                 X = X.reshape(-1, 1)
             if X.ndim != 2:
                 raise ValueError("X must be either a one or two dimensional array of data")
+            if (np.issubdtype(X.dtype, np.integer) or np.issubdtype(X.dtype, np.floating)) and all(dtype == np.float64 for dtype in getattr(self, 'X_dtypes', [])):
+                # numeric array, cast as a whole instead of per column
+                return _check_X(X.astype(np.float64, order='C')), [np.dtype(np.float64)] * X.shape[1]
             X = [X[:,i] for i in range(X.shape[1])]
         else:
             raise ValueError("X must be list, numpy.ndarray, pandas.Series, or torch.Tensor")
@@ -329,7 +334,7 @@ class Data:
                 raise ValueError("X must have %d input dimensions" % (len(self.X_dtypes),))
             for i in range(input_dims):
                 try:
-                    X[i] = X[i].astype(self.X_dtypes[i])
+                    X[i] = X[i].astype(self.X_dtypes[i], copy=False)
                 except:
                     raise ValueError("X data must have valid data types for each input dimension")
         else:
@@ -337,12 +342,12 @@ class Data:
                 if X[i].dtype == np.object_ or np.issubdtype(X[i].dtype, np.character):
                     # convert datetime.datetime or strings to np.datetime64
                     try:
-                        X[i] = X[i].astype(np.datetime64)
+                        X[i] = _parse_datetime64(X[i])
                     except:
                         raise ValueError("X data must have a number or datetime data type")
                 elif not np.issubdtype(X[i].dtype, np.datetime64):
                     try:
-                        X[i] = X[i].astype(np.float64)
+                        X[i] = X[i].astype(np.float64, copy=False)
                     except:
                         raise ValueError("X data must have a number or datetime data type")
 
@@ -351,20 +356,17 @@ class Data:
                     X[i] = _datetime64_to_higher_unit(X[i])
 
         dtypes = [x.dtype for x in X]
-        X = np.array([x.astype(np.float64) for x in X]).T
-        if X.size == 0:
-            raise ValueError("X data must not be empty")
-        if not np.isfinite(X).all():
-            raise ValueError("X data must not contains NaNs or infinities")
-        return X, dtypes # shape (n,input_dims)
+        X = np.stack([x.astype(np.float64, copy=False) for x in X], axis=1)
+        return _check_X(X), dtypes # shape (n,input_dims)
 
     def _format_Y(self, Y):
         if isinstance(Y, list):
-            if not all(isinstance(y, (int, float)) for y in Y):
+            types = _get_types(Y)
+            if not _is_subclass_types(types, (int, float)):
                 raise ValueError("Y list items must all be numbers")
-            elif not _is_homogeneous_type(Y):
+            elif 1 < len(types):
                 raise ValueError("Y list items must all have elements of the same type")
-            Y = np.array(Y)
+            Y = np.asarray(Y)
         elif isinstance(Y, pd.Series):
             Y = Y.to_numpy()
         elif isinstance(Y, torch.Tensor):
@@ -374,7 +376,7 @@ class Data:
 
         # try to cast unknown data types, Y becomes np.float64
         try:
-            Y = Y.astype(np.float64)
+            Y = Y.astype(np.float64, copy=False)
         except:
             raise ValueError("Y data must have a number data type")
 
@@ -406,6 +408,17 @@ class Data:
         """
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo):
+        # copy arrays directly and only deepcopy the remaining (small) attributes
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for key, val in self.__dict__.items():
+            if isinstance(val, np.ndarray):
+                setattr(result, key, val.copy())
+            else:
+                setattr(result, key, copy.deepcopy(val, memo))
+        return result
+
     def set_name(self, name):
         """
         Set name for data channel.
@@ -451,7 +464,7 @@ class Data:
         Examples:
             >>> data.set_function(lambda x,y: np.sin(3*x)+np.cos(2*y))
         """
-        _check_function(f, self.get_input_dims(), [_is_datetime64(self.X_dtypes[i]) for i in range(self.get_input_dims())])
+        _check_function(f, self.get_input_dims(), [_is_datetime64(dtype) for dtype in self.X_dtypes])
         self.F = f
 
     def transform(self, transformer):
@@ -488,11 +501,11 @@ class Data:
         end = self._normalize_x_val(end, dim=dim)
         
         if dim is not None:
-            ind = np.logical_and(self.X[:,dim] >= start[dim], self.X[:,dim] < end[dim])
+            ind = _range_mask(self.X[:,dim], start[dim], end[dim])
         else:
-            ind = np.logical_and(self.X[:,0] >= start[0], self.X[:,0] < end[0])
+            ind = _range_mask(self.X[:,0], start[0], end[0])
             for i in range(1,self.get_input_dims()):
-                ind = np.logical_and(ind, np.logical_and(self.X[:,i] >= start[i], self.X[:,i] < end[i]))
+                ind &= _range_mask(self.X[:,i], start[i], end[i])
 
         self.X = self.X[ind,:]
         self.Y = self.Y[ind]
@@ -519,26 +532,28 @@ class Data:
         if 1 < self.get_input_dims():
             raise ValueError("aggregate works only with a single input dimension")
 
-        start = np.min(self.X[:,0])
-        end = np.max(self.X[:,0])
+        x = self.X[:,0]
+        start = np.min(x)
+        end = np.max(x)
         step = _parse_delta(duration, self.X_dtypes[0])
         if f_err is None:
             f_err = f
 
         X = np.arange(start+step/2, end+step/2, step).reshape(-1,1)
-        Y = np.empty((X.shape[0],))
+
+        # sort once and find the bucket edges by bisection instead of masking the data per bucket
+        order = np.argsort(x, kind='stable')
+        edges = np.append(X[:,0]-step/2, X[-1,0]+step/2)
+        idx = np.searchsorted(x[order], edges, side='left')
+        order = order[:idx[-1]]
+        Y = np.array([f(y) for y in np.split(self.Y[order], idx[1:-1])], dtype=np.float64)
         if self.Y_err is not None:
-            Y_err = np.empty((X.shape[0],))
-        for i in range(X.shape[0]):
-            ind = (self.X[:,0] >= X[i,0]-step/2) & (self.X[:,0] < X[i,0]+step/2)
-            Y[i] = f(self.Y[ind])
-            if self.Y_err is not None:
-                Y_err[i] = f_err(self.Y_err[ind])
+            Y_err = np.array([f_err(y_err) for y_err in np.split(self.Y_err[order], idx[1:-1])], dtype=np.float64)
         self.X = X
         self.Y = Y
         if self.Y_err is not None:
             self.Y_err = Y_err
-        self.mask = np.array([True] * len(self.Y))
+        self.mask = np.ones(len(self.Y), dtype=bool)
 
     ################################################################
 
@@ -614,9 +629,10 @@ class Data:
         Examples:
             >>> x, y = data.get_train_data()
         """
+        X = self.X[self.mask,:]
         if transformed:
-            return self.X[self.mask,:], self.Y_transformer.forward(self.Y[self.mask], self.X[self.mask,:])
-        return self.X[self.mask,:], self.Y[self.mask]
+            return X, self.Y_transformer.forward(self.Y[self.mask], X)
+        return X, self.Y[self.mask]
 
     def get_test_data(self, transformed=False):
         """
@@ -744,28 +760,29 @@ class Data:
             >>> data = mogptk.LoadCSV('gold.csv', 'Date', 'Price')
             >>> data.remove_range('2016-01-15', '2016-06-15')
         """
+        input_dims = self.get_input_dims()
         if start is None:
             if dim is None:
-                start = [np.min(self.X[:,i]) for i in range(self.get_input_dims())]
+                start = [np.min(self.X[:,i]) for i in range(input_dims)]
             else:
-                start = [np.min(self.X[:,i]) if i == dim else None for i in range(self.get_input_dims())]
+                start = [np.min(self.X[:,i]) if i == dim else None for i in range(input_dims)]
         if end is None:
             if dim is None:
-                end = [np.max(self.X[:,i]) for i in range(self.get_input_dims())]
+                end = [np.max(self.X[:,i]) for i in range(input_dims)]
             else:
-                end = [np.max(self.X[:,i]) if i == dim else None for i in range(self.get_input_dims())]
+                end = [np.max(self.X[:,i]) if i == dim else None for i in range(input_dims)]
 
         start = self._normalize_x_val(start, dim=dim)
         end = self._normalize_x_val(end, dim=dim)
 
         if dim is not None:
-            mask = np.logical_and(self.X[:,dim] >= start[dim], self.X[:,dim] <= end[dim])
+            mask = _range_mask(self.X[:,dim], start[dim], end[dim], inclusive=True)
             self._add_range(start[dim], end[dim], dim)
         else:
-            mask = np.logical_and(self.X[:,0] >= start[0], self.X[:,0] <= end[0])
-            for i in range(1,self.get_input_dims()):
-                mask = np.logical_or(mask, np.logical_and(self.X[:,i] >= start[i], self.X[:,i] <= end[i]))
-            for i in range(self.get_input_dims()):
+            mask = _range_mask(self.X[:,0], start[0], end[0], inclusive=True)
+            for i in range(1,input_dims):
+                mask |= _range_mask(self.X[:,i], start[i], end[i], inclusive=True)
+            for i in range(input_dims):
                 self._add_range(start[i], end[i], i)
         self.mask[mask] = False
     
@@ -778,14 +795,18 @@ class Data:
             end (float): End percentage in interval [0,1].
             dim (int): Input dimension to apply to, if not specified applies to all input dimensions.
         """
+        input_dims = self.get_input_dims()
         start = self._normalize_x_val(start, dim=dim)
         end = self._normalize_x_val(end, dim=dim)
 
-        xmin = [np.min(self.X[:,i]) for i in range(self.get_input_dims())]
-        xmax = [np.max(self.X[:,i]) for i in range(self.get_input_dims())]
-        for i in range(self.get_input_dims()):
-            start[i] = xmin[i] + max(0.0, min(1.0, start[i])) * (xmax[i]-xmin[i])
-            end[i] = xmin[i] + max(0.0, min(1.0, end[i])) * (xmax[i]-xmin[i])
+        xmin = np.min(self.X, axis=0)
+        xmax = np.max(self.X, axis=0)
+        for i in range(input_dims) if dim is None else [dim]:
+            # clamp to [0,1] with comparisons instead of nested min/max calls
+            s = 0.0 if start[i] < 0.0 else 1.0 if 1.0 < start[i] else start[i]
+            e = 0.0 if end[i] < 0.0 else 1.0 if 1.0 < end[i] else end[i]
+            start[i] = xmin[i] + s * (xmax[i]-xmin[i])
+            end[i] = xmin[i] + e * (xmax[i]-xmin[i])
         self.remove_range(start, end, dim)
 
     def remove_random_ranges(self, n, duration, dim=0):
@@ -806,17 +827,26 @@ class Data:
             return
 
         delta = _parse_delta(duration, self.X_dtypes[dim])
-        m = (np.max(self.X[:,dim])-np.min(self.X[:,dim])) - n*delta
+        X = np.ascontiguousarray(self.X[:,dim])
+        xmax = np.max(X)
+        m = (xmax-np.min(X)) - n*delta
         if m <= 0:
             raise ValueError("no data left after removing ranges")
 
-        locs = self.X[:,dim] <= (np.max(self.X[:,dim])-delta)
-        locs[sum(locs)] = True # make sure the last data point can be deleted
+        # sort once so that the neighbourhood of each removed range is found by bisection
+        order = np.argsort(X, kind='stable')
+        X_sorted = X[order]
+
+        locs = X <= (xmax-delta)
+        locs[np.searchsorted(X_sorted, xmax-delta, side='right')] = True # make sure the last data point can be deleted
         for i in range(n):
-            if self.X[locs,dim].shape[0] == 0:
+            candidates = np.flatnonzero(locs)
+            if candidates.shape[0] == 0:
                 break # range could not be removed, there is no remaining data range of width delta
-            x = self.X[locs,dim][torch.randint(high=self.X[locs,dim].shape[0], size=())]
-            locs[(self.X[:,dim] > x-delta) & (self.X[:,dim] < x+delta)] = False
+            x = X[candidates[torch.randint(high=candidates.shape[0], size=())]]
+            lo = np.searchsorted(X_sorted, x-delta, side='right')
+            hi = np.searchsorted(X_sorted, x+delta, side='left')
+            locs[order[lo:hi]] = False
             self.remove_range(x, x+delta, dim)
 
     def remove_indices(self, indices):
@@ -882,16 +912,17 @@ class Data:
             >>> data = mogptk.LoadCSV('gold.csv', 'Date', 'Price')
             >>> data.set_prediction_range('2016-01-15', '2016-06-15', step='1D')
         """
+        input_dims = self.get_input_dims()
         if start is None:
-            start = [np.min(self.X[:,i]) for i in range(self.get_input_dims())]
+            start = [np.min(self.X[:,i]) for i in range(input_dims)]
         if end is None:
-            end = [np.max(self.X[:,i]) for i in range(self.get_input_dims())]
+            end = [np.max(self.X[:,i]) for i in range(input_dims)]
         
         start = self._normalize_x_val(start)
         end = self._normalize_x_val(end)
         n = self._normalize_val(n)
         step = self._normalize_val(step)
-        for i in range(self.get_input_dims()):
+        for i in range(input_dims):
             if n is not None and not isinstance(n[i], int):
                 raise ValueError("n must be integer")
             if step is not None and _is_datetime64(self.X_dtypes[i]):
@@ -901,8 +932,8 @@ class Data:
             raise ValueError("start must be lower than end")
 
         # TODO: prediction range for multi input dimension; fix other axes to zero so we can plot?
-        X_pred = [np.array([])] * self.get_input_dims()
-        for i in range(self.get_input_dims()):
+        X_pred = [np.array([])] * input_dims
+        for i in range(input_dims):
             if n is not None and n[i] is not None:
                 X_pred[i] = start[i] + (end[i]-start[i])*np.linspace(0.0, 1.0, n[i])
             else:
@@ -912,12 +943,16 @@ class Data:
                     x_step = _parse_delta(step[i], self.X_dtypes[i])
                 X_pred[i] = np.arange(start[i], end[i]+x_step, x_step)
 
-        n = [X_pred[i].shape[0] for i in range(self.get_input_dims())]
-        for i in range(self.get_input_dims()):
+        if input_dims == 1:
+            self.X_pred = X_pred[0].reshape(-1,1)
+            return
+
+        n = [X_pred[i].shape[0] for i in range(input_dims)]
+        for i in range(input_dims):
             n_tile = np.prod(n[:i])
             n_repeat = np.prod(n[i+1:])
             X_pred[i] = np.tile(np.repeat(X_pred[i], n_repeat), n_tile)
-        self.X_pred = np.array(X_pred).T
+        self.X_pred = np.stack(X_pred, axis=1)
 
     ################################################################
 
@@ -933,24 +968,30 @@ class Data:
         """
         input_dims = self.get_input_dims()
         nyquist = np.empty((input_dims,))
-        for i in range(self.get_input_dims()):
-            x = np.sort(self.X[self.mask,i])
-            dist = np.abs(x[1:]-x[:-1])
-            if len(dist) == 0:
+        for i in range(input_dims):
+            x = self.X[self.mask,i]
+            dist = np.diff(x)
+            if not np.all(0.0 <= dist):
+                # skip the sort for already sorted data
+                dist = np.diff(np.sort(x))
+            # reduce over the positive distances without gathering them into a new array
+            dist = np.min(dist, where=0.0 < dist, initial=np.inf)
+            if np.isinf(dist):
                 nyquist[i] = 0.0
             else:
-                dist = np.min(dist[np.nonzero(dist)])
                 nyquist[i] = 0.5/dist
         return nyquist
 
-    def _get_psd_peaks(self, w, psd):
+    def _get_psd_peaks(self, w, psd, Q=None):
         # Gaussian: f(x) = A / sqrt(2*pi*C^2) * exp(-(x-B)^2 / (2C^2))
         # i.e. A is the amplitude or peak height, B the mean or peak position, and C the std.dev. or peak width
+        from scipy import signal  # scipy.signal is slow to import
         peaks, _ = signal.find_peaks(psd)
         if len(peaks) == 0:
             return np.array([]), np.array([]), np.array([])
         peaks = peaks[np.argsort(psd[peaks])[::-1]] # sort by biggest peak first
         peaks = peaks[0.0 < psd[peaks]] # filter out negative peaks which sometimes occur
+        peaks = peaks[:Q] # only measure the widths of the peaks we return
 
         widths, _, _, _ = signal.peak_widths(psd, peaks, rel_height=0.5)
         widths *= w[1]-w[0]
@@ -984,21 +1025,17 @@ class Data:
         nyquist = self.get_nyquist_estimation()
         x, y = self.get_train_data(transformed=True)
         for i in range(input_dims):
-            w = np.linspace(0.0, nyquist[i], n)[1:]
-            psd = signal.lombscargle(x[:,i]*2.0*np.pi, y, w)
+            w = np.linspace(nyquist[i]/(n-1), nyquist[i], n-1)
+            psd = _lombscargle(x[:,i]*2.0*np.pi, y, w)
             psd /= x.shape[0]/4.0
-            amplitudes, positions, variances = self._get_psd_peaks(w, psd)
+            amplitudes, positions, variances = self._get_psd_peaks(w, psd, Q)
             if len(positions) == 0:
                 continue
-            if Q < len(amplitudes):
-                amplitudes = amplitudes[:Q]
-                positions = positions[:Q]
-                variances = variances[:Q]
-
-            n = len(amplitudes)
-            A[:n,i] = amplitudes
-            B[:n,i] = positions
-            C[:n,i] = variances
+
+            num = len(amplitudes)
+            A[:num,i] = amplitudes
+            B[:num,i] = positions
+            C[:num,i] = variances
         return A, B, C
 
     def get_bnse_estimation(self, Q=1, n=1000, iters=200):
@@ -1035,15 +1072,10 @@ class Data:
             # TODO: why? emperically found
             psd /= (np.max(x[:,i])-np.min(x[:,i]))**2
             psd *= np.pi
-            amplitudes, positions, variances = self._get_psd_peaks(w, psd)
+            amplitudes, positions, variances = self._get_psd_peaks(w, psd, Q)
             if len(positions) == 0:
                 continue
 
-            if Q < len(amplitudes):
-                amplitudes = amplitudes[:Q]
-                positions = positions[:Q]
-                variances = variances[:Q]
-
             num = len(amplitudes)
             A[:num,i] = amplitudes
             B[:num,i] = positions
@@ -1113,16 +1145,20 @@ class Data:
         if ax is None:
             _, ax = plt.subplots(1, 1, figsize=(12,4), squeeze=True, constrained_layout=True)
 
+        # select the training data once, it is used for the error bars and the data points
+        x_train, y_train = self.get_train_data(transformed=transformed)
+
         legends = []
         if errorbars and self.Y_err is not None:
-            x, y = self.get_train_data(transformed=transformed)
-            yl = self.Y[self.mask] - self.Y_err[self.mask]
-            yu = self.Y[self.mask] + self.Y_err[self.mask]
+            y = self.Y[self.mask]
+            y_err = self.Y_err[self.mask]
+            yl = y - y_err
+            yu = y + y_err
             if transformed:
-                yl = self.Y_transformer.forward(yl, x)
-                yu = self.Y_transformer.forward(yu, x)
-            x = x.astype(self.X_dtypes[0])
-            ax.errorbar(x, y, [y-yl, yu-y], elinewidth=1.5, ecolor='lightgray', capsize=0, ls='', marker='')
+                yl = self.Y_transformer.forward(yl, x_train)
+                yu = self.Y_transformer.forward(yu, x_train)
+            x = x_train.astype(self.X_dtypes[0])
+            ax.errorbar(x, y_train, [y_train-yl, yu-y_train], elinewidth=1.5, ecolor='lightgray', capsize=0, ls='', marker='')
 
         if self.X_pred is None:
             xmin = np.min(self.X)
@@ -1134,7 +1170,6 @@ class Data:
         if self.F is not None:
             if _is_datetime64(self.X_dtypes[0]):
                 dt = np.timedelta64(1,_get_time_unit(self.X_dtypes[0]))
-                n = int((xmax-xmin) / dt) + 1
                 x = np.arange(xmin, xmax+np.timedelta64(1,'us'), dt, dtype=self.X_dtypes[0])
             else:
                 n = len(self.X)*10
@@ -1142,7 +1177,7 @@ class Data:
 
             y = self.F(x)
             if transformed:
-                y = self.Y_transformer.forward(y, x)
+                y = self.Y_transformer.forward(y, x.astype(np.float64, copy=False).reshape(-1,1))
 
             ax.plot(x, y, 'g--', lw=1)
             legends.append(plt.Line2D([0], [0], ls='--', color='g', label='Latent'))
@@ -1153,9 +1188,8 @@ class Data:
             ax.plot(x, y, 'r.', ms=10)
             legends.append(plt.Line2D([0], [0], ls='', color='r', marker='.', ms=10, label='Test data'))
 
-        x, y = self.get_train_data(transformed=transformed)
-        x = x.astype(self.X_dtypes[0])
-        ax.plot(x, y, 'k.', ms=10)
+        x = x_train.astype(self.X_dtypes[0])
+        ax.plot(x, y_train, 'k.', ms=10)
         legends.append(plt.Line2D([0], [0], ls='', color='k', marker='.', ms=10, label='Train data'))
 
         if 0 < len(self.removed_ranges[0]):
@@ -1219,7 +1253,7 @@ class Data:
             else:
                 X_scale = 1.0/_parse_delta(per, self.X_dtypes[0])
                 if not isinstance(per, str):
-                    per = '%s' % (unit,)
+                    per = '%s' % (per,)
 
         if per is not None:
             ax.set_xlabel('Frequency [1/'+per+']', fontsize=14)
@@ -1231,8 +1265,12 @@ class Data:
         if transformed:
             Y = self.Y_transformer.forward(Y, X)
 
-        idx = np.argsort(X[:,0])
-        X = X[idx,0] * X_scale
+        idx = _argsort(X[:,0])
+        X = X[idx,0]
+        if isinstance(idx, slice):
+            X = X * X_scale  # copy the view, BNSE centers its input in place
+        else:
+            X *= X_scale  # fancy indexing already returned a copy
         Y = Y[idx]
 
         nyquist = maxfreq
@@ -1242,8 +1280,8 @@ class Data:
 
         Y_freq_err = np.array([])
         if method.lower() == 'ls':
-            X_freq = np.linspace(0.0, nyquist, n+1)[1:]
-            Y_freq = signal.lombscargle(X*2.0*np.pi, Y, X_freq)
+            X_freq = np.linspace(nyquist/n, nyquist, n)
+            Y_freq = _lombscargle(X*2.0*np.pi, Y, X_freq)
         elif method.lower() == 'bnse':
             X_freq, Y_freq, Y_freq_err = BNSE(X, Y, max_freq=nyquist, n=n)
         else:
@@ -1280,38 +1318,45 @@ class Data:
 
     def _normalize_val(self, val):
         # normalize input values, that is: expand to input_dims if a single value
+        input_dims = self.get_input_dims()
         if val is None:
             return val
+        if type(val) in _scalar_types:
+            # common case of a plain scalar, skips the isinstance checks including the ABC lookup below
+            return [val] * input_dims
         if isinstance(val, np.ndarray):
             if val.ndim == 0:
-                val = [val.item()]
+                val = [val.item()] * input_dims
             else:
                 val = list(val)
         elif _is_iterable(val):
             val = list(val)
         else:
-            val = [val] * self.get_input_dims()
-        if len(val) != self.get_input_dims():
+            val = [val] * input_dims
+        if len(val) != input_dims:
             raise ValueError("value must be a scalar or a list of values for each input dimension")
         return val
 
     def _normalize_x_val(self, val, dim=None):
         # normalize input values for X axis, that is: expand to input_dims if a single value, convert values to appropriate dtype
 
+        input_dims = self.get_input_dims()
         val = self._normalize_val(val)
         if dim is not None:
             try:
-                val[dim] = np.array(val[dim]).astype(self.X_dtypes[dim]).astype(np.float64)
+                val[dim] = _x_val_to_float64(val[dim], self.X_dtypes[dim])
             except:
                 raise ValueError("value must be of type %s" % (self.X_dtypes[dim],))
         else:
-            for i in range(self.get_input_dims()):
+            for i in range(input_dims):
                 try:
-                    val[i] = np.array(val[i]).astype(self.X_dtypes[i]).astype(np.float64)
+                    val[i] = _x_val_to_float64(val[i], self.X_dtypes[i])
                 except:
                     raise ValueError("value must be of type %s" % (self.X_dtypes[i],))
         return val
 
+_scalar_types = (int, float, str, np.float64, np.int64, np.datetime64)
+
 def _is_iterable(val):
     return isinstance(val, collections.abc.Iterable) and not isinstance(val, (dict, str))
 
@@ -1320,6 +1365,13 @@ def _is_homogeneous_type(seq):
     first = type(next(it))
     return all(type(x) is first for x in it)
 
+def _get_types(seq):
+    # distinct element types, collected in a single pass at C level
+    return set(map(type, seq))
+
+def _is_subclass_types(types, classinfo):
+    return all(issubclass(t, classinfo) for t in types)
+
 def _check_function(f, input_dims, is_datetime64):
     if not inspect.isfunction(f):
         raise ValueError("must pass a function with %d parameters" % (input_dims,))
@@ -1358,33 +1410,42 @@ duration_regex = re.compile(
     r'((?P<microseconds>[\.\d]+?)us)?$'
 )
 
+_duration_units = {
+    'year': 'Y', 'years': 'Y',
+    'month': 'M', 'months': 'M',
+    'week': 'W', 'weeks': 'W',
+    'day': 'D', 'days': 'D',
+    'hour': 'h', 'hours': 'h',
+    'minute': 'm', 'minutes': 'm',
+    'second': 's', 'seconds': 's',
+    'millisecond': 'ms', 'milliseconds': 'ms',
+    'microsecond': 'us', 'microseconds': 'us',
+}
+
+_duration_groups = (
+    ('years', 'Y'),
+    ('months', 'M'),
+    ('weeks', 'W'),
+    ('days', 'D'),
+    ('hours', 'h'),
+    ('minutes', 'm'),
+    ('seconds', 's'),
+    ('milliseconds', 'ms'),
+    ('microseconds', 'us'),
+)
+
 def _parse_delta(text, dtype):
     if np.issubdtype(dtype, np.datetime64):
         dtype = 'timedelta64[%s]' % str(dtype)[-2]
 
-    val = None
     if not isinstance(text, str):
-        val = np.array(text)
-    elif text == 'year' or text == 'years':
-        val = np.timedelta64(1,'Y')
-    elif text == 'month' or text == 'months':
-        val = np.timedelta64(1,'M')
-    elif text == 'week' or text == 'weeks':
-        val = np.timedelta64(1,'W')
-    elif text == 'day' or text == 'days':
-        val = np.timedelta64(1,'D')
-    elif text == 'hour' or text == 'hours':
-        val = np.timedelta64(1,'h')
-    elif text == 'minute' or text == 'minutes':
-        val = np.timedelta64(1,'m')
-    elif text == 'second' or text == 'seconds':
-        val = np.timedelta64(1,'s')
-    elif text == 'millisecond' or text == 'milliseconds':
-        val = np.timedelta64(1,'ms')
-    elif text == 'microsecond' or text == 'microseconds':
-        val = np.timedelta64(1,'us')
-    if val is not None:
-        return val.astype(dtype).astype(np.float64)
+        return np.array(text).astype(dtype).astype(np.float64)
+    return _parse_duration(text, dtype)
+
+@functools.lru_cache(maxsize=256)
+def _parse_duration(text, dtype):
+    if text in _duration_units:
+        return np.timedelta64(1,_duration_units[text]).astype(dtype).astype(np.float64)
 
     m = duration_regex.match(text)
     if m is None:
@@ -1392,26 +1453,96 @@ def _parse_delta(text, dtype):
 
     delta = 0
     matches = m.groupdict()
-    if matches['years']:
-        delta += np.timedelta64(np.int32(matches['years']),'Y')
-    if matches['months']:
-        delta += np.timedelta64(np.int32(matches['months']),'M')
-    if matches['weeks']:
-        delta += np.timedelta64(np.int32(matches['weeks']),'W')
-    if matches['days']:
-        delta += np.timedelta64(np.int32(matches['days']),'D')
-    if matches['hours']:
-        delta += np.timedelta64(np.int32(matches['hours']),'h')
-    if matches['minutes']:
-        delta += np.timedelta64(np.int32(matches['minutes']),'m')
-    if matches['seconds']:
-        delta += np.timedelta64(np.int32(matches['seconds']),'s')
-    if matches['milliseconds']:
-        delta += np.timedelta64(np.int32(matches['milliseconds']),'ms')
-    if matches['microseconds']:
-        delta += np.timedelta64(np.int32(matches['microseconds']),'us')
+    for group, unit in _duration_groups:
+        if matches[group]:
+            delta += np.timedelta64(np.int32(matches[group]),unit)
     return delta.astype(dtype).astype(np.float64)
 
+def _argsort(x):
+    # stable argsort of a 1D array, returns a view slice when x is already sorted such as for time series
+    if np.all(x[:-1] <= x[1:]):
+        return slice(None)
+    return np.argsort(x, kind='stable')
+
+def _lombscargle(x, y, freqs):
+    # Lomb-Scargle periodogram for angular frequencies, equal to scipy.signal.lombscargle but evaluated
+    # with vectorized (and multithreaded) torch operations over blocks of frequencies
+    x = torch.as_tensor(x, dtype=torch.float64).contiguous()
+    y = torch.as_tensor(y, dtype=torch.float64).contiguous()
+    freqs = torch.as_tensor(freqs, dtype=torch.float64)
+
+    pgram = torch.empty(freqs.shape, dtype=torch.float64)
+    size = max(1, 2**16 // max(1, x.shape[0]))  # blocks that stay in cache
+    for i in range(0, freqs.shape[0], size):
+        wx = freqs[i:i+size].reshape(-1,1) * x.reshape(1,-1)
+        c = torch.cos(wx)
+        s = torch.sin(wx)
+        cc = (c*c).sum(dim=1)
+        ss = (s*s).sum(dim=1)
+        cs = (c*s).sum(dim=1)
+        yc = c.mv(y)
+        ys = s.mv(y)
+
+        # time offset tau that makes the periodogram invariant to shifts in x
+        tau = 0.5*torch.atan2(2.0*cs, cc-ss)
+        ct = torch.cos(tau)
+        st = torch.sin(tau)
+        yct = ct*yc + st*ys
+        yst = ct*ys - st*yc
+        cct = ct*ct*cc + 2.0*ct*st*cs + st*st*ss
+        sst = st*st*cc - 2.0*ct*st*cs + ct*ct*ss
+        pgram[i:i+size] = 0.5*(yct**2/cct + yst**2/sst)
+    return pgram.numpy()
+
+def _range_mask(x, start, end, inclusive=False):
+    # mask of start <= x < end, or x <= end when inclusive, combined in place
+    mask = x >= start
+    if inclusive:
+        mask &= x <= end
+    else:
+        mask &= x < end
+    return mask
+
+def _check_X(X):
+    if X.size == 0:
+        raise ValueError("X data must not be empty")
+    if not np.isfinite(X).all():
+        raise ValueError("X data must not contains NaNs or infinities")
+    return X
+
+def _x_val_to_float64(val, dtype):
+    # casting on construction is the fast path, numpy parses ISO 8601 strings in C
+    try:
+        return np.asarray(val, dtype=dtype).astype(np.float64)
+    except (ValueError, TypeError):
+        pass
+    if isinstance(val, str) and np.issubdtype(dtype, np.datetime64):
+        try:
+            # other date formats
+            val = pd.Timestamp(val).to_datetime64()
+        except ValueError:
+            pass
+    return np.array(val).astype(dtype).astype(np.float64)
+
+def _pd_to_datetime64(array):
+    # timezone-aware dates are converted to UTC and made naive like numpy does, otherwise pandas returns an object array of Timestamps
+    return pd.to_datetime(array, utc=True, cache=True).tz_localize(None).to_numpy()
+
+def _parse_datetime64(array):
+    # parse a whole column at once, numpy converts datetime.datetime objects one by one
+    # while pandas does so in a single vectorized call
+    kind = pd.api.types.infer_dtype(array, skipna=True)
+    if kind in ('datetime', 'datetime64', 'date'):
+        return _pd_to_datetime64(array)
+    try:
+        # numpy parses ISO 8601 strings and keeps their unit, such as months or years
+        return array.astype(np.datetime64)
+    except ValueError:
+        if kind != 'string':
+            raise  # numbers are not dates
+        # other date formats
+        return _pd_to_datetime64(array)
+
 def _datetime64_to_higher_unit(array):
     if array.dtype in ['<M8[Y]', '<M8[M]', '<M8[W]', '<M8[D]']:
         return array
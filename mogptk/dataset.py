@@ -1,11 +1,36 @@
 import copy
+import importlib.util
 
 import torch
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from .data import Data, _is_iterable
+from .data import Data, _is_iterable, _parse_datetime64
+
+_has_pyarrow = importlib.util.find_spec('pyarrow') is not None
+
+# pandas.read_csv options that the pyarrow engine does not support
+_pyarrow_unsupported = {'chunksize', 'comment', 'converters', 'dayfirst', 'delim_whitespace', 'dialect', 'float_precision', 'iterator', 'lineterminator', 'low_memory', 'memory_map', 'nrows', 'quoting', 'skipfooter', 'skipinitialspace', 'thousands', 'verbose'}
+
+def _pyarrow_supports(kwargs):
+    # decide on the engine before reading, so that parse errors are raised and not retried with another engine
+    if any(key in _pyarrow_unsupported for key in kwargs):
+        return False
+    if 'sep' in kwargs or 'delimiter' in kwargs:
+        sep = kwargs.get('sep', kwargs.get('delimiter'))
+        if sep is None or len(sep) != 1:
+            return False  # no separator sniffing or regular expressions
+    usecols = kwargs.get('usecols')
+    if usecols is not None and (callable(usecols) or not all(isinstance(col, str) for col in usecols)):
+        return False  # only column names
+    na_values = kwargs.get('na_values')
+    if na_values is not None and not isinstance(na_values, str) and (isinstance(na_values, dict) or not all(isinstance(val, str) for val in na_values)):
+        return False  # only a list of strings
+    skiprows = kwargs.get('skiprows')
+    if skiprows is not None and not isinstance(skiprows, (int, np.integer)):
+        return False  # only a number of rows
+    return True
 
 def LoadCSV(filename, x_col=0, y_col=1, y_err_col=None, name=None, **kwargs):
     """
@@ -16,7 +41,7 @@ def LoadCSV(filename, x_col=0, y_col=1, y_err_col=None, name=None, **kwargs):
         x_col (int, str, list of int or str): Names or indices of X column(s) in CSV.
         y_col (int, str, list of int or str): Names or indices of Y column(s) in CSV.
         name (str, list): Name or names of data channels.
-        **kwargs: Additional keyword arguments for csv.DictReader.
+        **kwargs: Additional keyword arguments for pandas.read_csv. If pyarrow is installed and no engine is given, the pyarrow engine is used when it supports the given arguments. Passing `chunksize` reads large files in chunks of that many rows.
 
     Returns:
         mogptk.data.Data or mogptk.dataset.DataSet
@@ -26,9 +51,28 @@ def LoadCSV(filename, x_col=0, y_col=1, y_err_col=None, name=None, **kwargs):
         <mogptk.dataset.DataSet at ...>
         >>> LoadCSV('gold.csv', 'Date', 'Price', sep=' ', quotechar='|')
         <mogptk.dataset.DataSet at ...>
+        >>> LoadCSV('large.csv', 'Date', ['Open', 'Close'], chunksize=100000)
+        <mogptk.dataset.DataSet at ...>
     """
 
-    df = pd.read_csv(filename, **kwargs)
+    # only parse the columns we use when they are given by name
+    cols = []
+    for col in [x_col, y_col, y_err_col]:
+        if isinstance(col, (list, tuple)):
+            cols += list(col)
+        elif col is not None:
+            cols.append(col)
+    if 'usecols' not in kwargs and all(isinstance(col, str) for col in cols):
+        kwargs['usecols'] = list(dict.fromkeys(cols))
+
+    if 'engine' not in kwargs and _has_pyarrow and _pyarrow_supports(kwargs):
+        # pyarrow parses numbers and timestamps in multithreaded C++
+        kwargs['engine'] = 'pyarrow'
+    if 'chunksize' in kwargs:
+        with pd.read_csv(filename, **kwargs) as reader:
+            df = pd.concat(reader, ignore_index=True)
+    else:
+        df = pd.read_csv(filename, **kwargs)
 
     return LoadDataFrame(df, x_col, y_col, y_err_col, name)
 
@@ -100,20 +144,31 @@ def LoadDataFrame(df, x_col=0, y_col=1, y_err_col=None, name=None):
     if len(df.index) == 0:
         raise ValueError("dataframe cannot be empty")
 
+    # parse date columns once for all channels, columns of datetime64 dtype are passed through as-is
+    x_data = []
+    for col in x_col:
+        x = df[col].to_numpy()
+        if x.dtype == np.object_ or np.issubdtype(x.dtype, np.character):
+            try:
+                x = _parse_datetime64(x)
+            except:
+                pass  # let Data raise the error
+        x_data.append(x)
+
     dataset = DataSet()
     for i in range(len(y_col)):
         cols = x_col + [y_col[i]]
         if y_err_col is not None:
             cols += [y_err_col[i]]
-        channel = df[cols].dropna()
+        ind = df[cols].notna().all(axis=1).to_numpy()
 
         y_err = None
         if y_err_col is not None:
-            y_err = channel[y_err_col[i]].values
+            y_err = df[y_err_col[i]].to_numpy()[ind]
 
         dataset.append(Data(
-            [channel[col].values for col in x_col],
-            channel[y_col[i]].values,
+            [x[ind] for x in x_data],
+            df[y_col[i]].to_numpy()[ind],
             Y_err=y_err,
             name=name[i],
             x_labels=x_col,
@@ -7,6 +7,7 @@ class Config:
     else:
         device = torch.device('cpu')
     positive_minimum = 1e-8
+    prediction_chunk_size = 10000
 config = Config()
 
 def use_half_precision():
@@ -23,6 +24,16 @@ def use_single_precision():
     """
     config.dtype = torch.float32
 
+def use_tf32(enabled=True):
+    """
+    Allow TensorFloat-32 (TF32) for single precision matrix multiplications on CUDA. On Ampere GPUs or newer this speeds up the kernel and covariance products considerably, at the cost of a reduced mantissa for the products. Only has effect in combination with `use_single_precision()`, since double precision tensors never use TF32.
+
+    Args:
+        enabled (boolean): Allow or disallow TF32.
+    """
+    torch.backends.cuda.matmul.allow_tf32 = enabled
+    torch.backends.cudnn.allow_tf32 = enabled
+
 def use_double_precision():
     """
     Use double precision (float64) for all tensors. This is the recommended precision for numerical stability, but can be significantly slower.
@@ -71,3 +82,11 @@ def set_positive_minimum(val):
     Set the positive minimum for kernel parameters. This is usually slightly larger than zero to avoid numerical instabilities. Default is at 1e-8.
     """
     config.positive_minimum = val
+
+def set_prediction_chunk_size(n):
+    """
+    Set the maximum number of points predicted at once by the sparse variational models, larger predictions are split into chunks of this size to bound memory usage. Default is at 10000.
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("chunk size must be a positive integer")
+    config.prediction_chunk_size = n
@@ -1,4 +1,5 @@
 import torch
+import functools
 import numpy as np
 from . import config, Parameter
 
@@ -62,15 +63,23 @@ def log_logistic_distribution(loc, scale):
         ],
     )
 
+@functools.lru_cache(maxsize=None)
+def _hermgauss(deg):
+    # the nodes and weights only depend on the degree, while each likelihood would recompute them
+    t, w = np.polynomial.hermite.hermgauss(deg)
+    t.flags.writeable = False
+    w.flags.writeable = False
+    return t, w
+
 class GaussHermiteQuadrature:
     def __init__(self, deg=20, t_scale=None, w_scale=None):
-        t, w = np.polynomial.hermite.hermgauss(deg)
+        t, w = _hermgauss(deg)
         t = t.reshape(-1,1)
         w = w.reshape(-1,1)
         if t_scale is not None:
-            t *= t_scale
+            t = t * t_scale
         if w_scale is not None:
-            w *= w_scale
+            w = w * w_scale
         self.t = torch.tensor(t, device=config.device, dtype=config.dtype)  # degx1
         self.w = torch.tensor(w, device=config.device, dtype=config.dtype)  # degx1
         self.deg = deg
@@ -98,7 +107,7 @@ class Likelihood(torch.nn.Module):
             for p in self.parameters():
                 p.train = val
             return
-        if hasattr(self, name) and isinstance(getattr(self, name), Parameter):
+        if isinstance(self.__dict__.get('_parameters', {}).get(name), Parameter):  # registered parameters only live in _parameters
             raise AttributeError("parameter is read-only, use Parameter.assign()")
         if isinstance(val, Parameter) and val._name is None:
             val._name = '%s.%s' % (self.__class__.__name__, name)
@@ -353,28 +362,33 @@ class GaussianLikelihood(Likelihood):
             return mu
 
         if self.output_dims is not None:
-            var = self.scale()**2
+            scale = self.scale()
+            if sigma is None:
+                ci = torch.tensor(ci, device=config.device, dtype=config.dtype)
+                q = torch.erfinv(2.0*ci - 1.0)
             r = self._channel_indices(X)
             lower = torch.empty(mu.shape, device=config.device, dtype=config.dtype)
             upper = torch.empty(mu.shape, device=config.device, dtype=config.dtype)
             for i in range(self.output_dims):
+                std = torch.sqrt(var[r[i],:] + scale[i]**2)  # latent and observation variance
                 if sigma is None:
-                    ci = torch.tensor(ci, device=config.device, dtype=config.dtype)
-                    lower[r[i],:] = mu[r[i],:] + torch.sqrt(2.0*var[i])*self.scale()[i]*torch.erfinv(2.0*ci[0] - 1.0)
-                    upper[r[i],:] = mu[r[i],:] + torch.sqrt(2.0)*self.scale()[i]*torch.erfinv(2.0*ci[1] - 1.0)
+                    lower[r[i],:] = mu[r[i],:] + np.sqrt(2.0)*std*q[0]
+                    upper[r[i],:] = mu[r[i],:] + np.sqrt(2.0)*std*q[1]
                 else:
-                    lower[r[i],:] = mu[r[i],:] - sigma*self.scale()[i]
-                    upper[r[i],:] = mu[r[i],:] + sigma*self.scale()[i]
+                    lower[r[i],:] = mu[r[i],:] - sigma*std
+                    upper[r[i],:] = mu[r[i],:] + sigma*std
             return mu, lower, upper  # Nx1
 
         var += self.scale()**2
         if sigma is None:
             ci = torch.tensor(ci, device=config.device, dtype=config.dtype)
-            lower = mu + torch.sqrt(2.0*var)*torch.erfinv(2.0*ci[0] - 1.0)
-            upper = mu + torch.sqrt(2.0*var)*torch.erfinv(2.0*ci[1] - 1.0)
+            std = torch.sqrt(2.0*var)
+            lower = mu + std*torch.erfinv(2.0*ci[0] - 1.0)
+            upper = mu + std*torch.erfinv(2.0*ci[1] - 1.0)
         else:
-            lower = mu - sigma*var.sqrt()
-            upper = mu + sigma*var.sqrt()
+            std = sigma*var.sqrt()
+            lower = mu - std
+            upper = mu + std
         return mu, lower, upper
 
 class StudentTLikelihood(Likelihood):
@@ -29,7 +29,7 @@ class Mean(torch.nn.Module):
             for p in self.parameters():
                 p.train = val
             return
-        if hasattr(self, name) and isinstance(getattr(self, name), Parameter):
+        if isinstance(self.__dict__.get('_parameters', {}).get(name), Parameter):  # registered parameters only live in _parameters
             raise AttributeError("parameter is read-only, use Parameter.assign()")
         if isinstance(val, Parameter) and val._name is None:
             val._name = '%s.%s' % (self.__class__.__name__, name)
@@ -1,7 +1,6 @@
 import sys
 import torch
 import numpy as np
-from scipy.stats import qmc, gaussian_kde
 from IPython.display import display, HTML
 from . import Parameter, Mean, Kernel, MultiOutputKernel, Likelihood, MultiOutputLikelihood, GaussianLikelihood, config, plot_gram
 
@@ -14,21 +13,21 @@ def _init_grid(N, X):
         raise ValueError("number of inducing points must equal N = n^%d" % X.shape[1])
     n = int(n)
 
-    Z = torch.empty((N,X.shape[1]), device=config.device, dtype=config.dtype)
-    grid = torch.meshgrid([torch.linspace(torch.min(X[:,i]), torch.max(X[:,i]), n) for i in range(X.shape[1])], indexing='ij')
-    for i in range(X.shape[1]):
-        Z[:,i] = grid[i].flatten()
-    return Z
+    xmin = torch.min(X, dim=0).values
+    xmax = torch.max(X, dim=0).values
+    grid = torch.meshgrid([torch.linspace(xmin[i], xmax[i], n) for i in range(X.shape[1])], indexing='ij')
+    return torch.stack([g.flatten() for g in grid], dim=1).to(config.device, config.dtype)
 
 def _init_random(N, X):
+    from scipy.stats import qmc  # scipy.stats is slow to import
     sampler = qmc.Halton(d=X.shape[1])
     samples = torch.tensor(sampler.random(n=N), device=config.device, dtype=config.dtype)
-    Z = torch.empty((N,X.shape[1]), device=config.device, dtype=config.dtype)
-    for i in range(X.shape[1]):
-        Z[:,i] = torch.min(X[:,i]) + (torch.max(X[:,i])-torch.min(X[:,i]))*samples[:,i]
-    return Z
+    xmin = torch.min(X, dim=0).values
+    xmax = torch.max(X, dim=0).values
+    return xmin + (xmax-xmin)*samples
 
 def _init_density(N, X):
+    from scipy.stats import gaussian_kde  # scipy.stats is slow to import
     kernel = gaussian_kde(X.T.detach().cpu().numpy(), bw_method='scott')
     Z = torch.tensor(kernel.resample(N).T, device=config.device, dtype=config.dtype)
     return Z
@@ -58,11 +57,17 @@ def init_inducing_points(Z, X, method='grid', output_dims=None):
                 Z = [Z] * output_dims
             M = Z
             Z = torch.zeros((sum(M),X.shape[1]))
-            for j in range(len(M)):
-                m0 = sum(M[:j])
-                m = M[j]
+
+            # group the data points by channel with one stable sort instead of masking X for every channel
+            channel = X[:,0].long()
+            counts = torch.bincount(channel, minlength=output_dims).tolist()
+            X_channels = torch.split(X[torch.argsort(channel, stable=True),1:], counts)
+
+            m0 = 0
+            for j, m in enumerate(M):
                 Z[m0:m0+m,0] = j
-                Z[m0:m0+m,1:] = _init(m, X[X[:,0] == j,1:])
+                Z[m0:m0+m,1:] = _init(m, X_channels[j])
+                m0 += m
     elif isinstance(Z, int):
         M = Z
         Z = _init(M, X)
@@ -112,11 +117,14 @@ class Model(torch.nn.Module):
         self.kernel = kernel
         self.X = X
         self.y = y
+        self._X_channel = X[:,0].long() if kernel.output_dims is not None else None  # channel IDs of the training data
         self.mean = mean
         self.likelihood = likelihood
         self.jitter = jitter
         self.input_dims = X.shape[1]
         self._compiled_forward = None
+        self._predict_cache = None
+        self._cholesky_infos = None
 
     def name(self):
         return self.__class__.__name__
@@ -133,10 +141,17 @@ class Model(torch.nn.Module):
         state.pop('_compiled_call_impl', None)
         state['_modules'] = state['_modules'].copy()
         state['_modules'].pop('_compiled_forward', None)
+        state['_predict_cache'] = None
         return state
 
+    def __setstate__(self, state):
+        # models pickled by earlier versions lack the caches
+        state.setdefault('_predict_cache', None)
+        state.setdefault('_cholesky_infos', None)
+        super().__setstate__(state)
+
     def __setattr__(self, name, val):
-        if hasattr(self, name) and isinstance(getattr(self, name), Parameter):
+        if isinstance(self.__dict__.get('_parameters', {}).get(name), Parameter):  # registered parameters only live in _parameters
             raise AttributeError("parameter is read-only, use Parameter.assign()")
         if isinstance(val, Parameter) and val._name is None:
             val._name = '%s.%s' % (self.__class__.__name__, name)
@@ -180,9 +195,17 @@ class Model(torch.nn.Module):
                 raise ValueError("X must have %s input dimensions" % self.input_dims)
             return X
 
+    def _K_blocks(self, X1, *X2):
+        # evaluate the cross covariances against several inputs in one call and split the columns, which mostly saves per-call overhead of the multi-output kernels
+        # this must not be used for K(X1,X1), since kernels such as the WhiteKernel only add their diagonal when X2 is None
+        K = self.kernel(X1, torch.cat(X2, dim=0))
+        return K.split([x.shape[0] for x in X2], dim=1)
+
     def _index_channel(self, value, X):
         if self.kernel.output_dims is not None and 0 < value.ndim and value.shape[0] == self.kernel.output_dims:
-            return torch.index_select(value, dim=0, index=X[:,0].long())
+            # reuse the channel IDs of the training data instead of casting them on every evaluation
+            index = self._X_channel if X is self.X else X[:,0].long()
+            return torch.index_select(value, dim=0, index=index)
         return value
     
     def print_parameters(self, file=None):
@@ -190,15 +213,18 @@ class Model(torch.nn.Module):
         Print parameters and their values.
         """
         def param_range(lower, upper, train=True, pegged=False):
+            # limits are reduced on the host so that each one costs a single transfer
             if lower is not None:
-                if lower.size == 1:
+                lower = lower.cpu()
+                if lower.numel() == 1:
                     lower = lower.item()
                 elif (lower.max()-lower.min())/lower.mean() < 1e-6:
                     lower = lower.mean().item()
                 else:
                     lower = lower.tolist()
             if upper is not None:
-                if upper.size == 1:
+                upper = upper.cpu()
+                if upper.numel() == 1:
                     upper = upper.item()
                 elif (upper.max()-upper.min())/upper.mean() < 1e-6:
                     upper = upper.mean().item()
@@ -217,42 +243,97 @@ class Model(torch.nn.Module):
                 return "[%s, ∞)" % lower
             return "[%s, %s]" % (lower, upper)
 
+        # transfer all parameter values to the host at once instead of one at a time
+        params = list(self.parameters())
+        with torch.no_grad():
+            values = [p.constrained for p in params]
+            shapes = [value.shape for value in values]
+            if 0 < len(values):
+                values = torch.cat([value.reshape(-1) for value in values]).cpu().numpy()
+                values = np.split(values, np.cumsum([np.prod(shape, dtype=int) for shape in shapes])[:-1])
+            values = [value.reshape(shape) for value, shape in zip(values, shapes)]
+
         if file is None:
             try:
                 get_ipython  # fails if we're not in a notebook
                 table = '<table><tr><th style="text-align:left">Name</th><th>Range</th><th>Value</th></tr>'
-                for p in self.parameters():
-                    table += '<tr><td style="text-align:left">%s</td><td>%s</td><td>%s</td></tr>' % (p._name, param_range(p.lower, p.upper, p.train, p.pegged), p.numpy())
+                for p, value in zip(params, values):
+                    table += '<tr><td style="text-align:left">%s</td><td>%s</td><td>%s</td></tr>' % (p._name, param_range(p.lower, p.upper, p.train, p.pegged), value)
                 table += '</table>'
                 display(HTML(table))
                 return
             except Exception as e:
                 pass
 
-        vals = [["Name", "Range", "Value"]]
-        for p in self.parameters():
-            vals.append([p._name, param_range(p.lower, p.upper, p.train, p.pegged), p.numpy().tolist()])
+        # the range is not printed in plain text, so it is not computed either
+        vals = [["Name", "Value"]]
+        for p, value in zip(params, values):
+            vals.append([p._name, value.tolist()])
 
         nameWidth = max([len(val[0]) for val in vals])
-        rangeWidth = max([len(val[1]) for val in vals])
         for val in vals:
-            #print("%-*s  %-*s  %s" % (nameWidth, val[0], rangeWidth, val[1], val[2]), file=file)
-            print("%-*s  %s" % (nameWidth, val[0], val[2]), file=file)
+            print("%-*s  %s" % (nameWidth, val[0], val[1]), file=file)
+
+    def _parameters_state(self):
+        return [p.constrained.detach().clone() for p in self.parameters()]
+
+    def _get_predict_cache(self):
+        # return the factorizations cached by the last prediction if no parameter has changed since
+        if self._predict_cache is None:
+            return None
+        state, value = self._predict_cache
+        params = self._parameters_state()
+        if len(state) != len(params) or not all(torch.equal(a, b) for a, b in zip(state, params)):
+            return None
+        return value
+
+    def _set_predict_cache(self, *value):
+        self._predict_cache = (self._parameters_state(), value)
+
+    def _seed_predict_cache(self, *value):
+        # evaluations without autograd (not training) share their factorizations with the next prediction
+        if not torch.is_grad_enabled() and not torch.jit.is_tracing():
+            self._set_predict_cache(*value)
+
+    def _reuse_predict_cache(self):
+        # evaluations without autograd (not training) may reuse the factorizations of an earlier evaluation or prediction
+        if not torch.is_grad_enabled() and not torch.jit.is_tracing():
+            return self._get_predict_cache()
+        return None
 
     def _cholesky(self, K, add_jitter=False):
         if add_jitter:
-            K = K + (self.jitter * K.diagonal().mean()).repeat(K.shape[0]).diagflat()
-        try:
+            # add to the diagonal of a copy instead of building a dense NxN jitter matrix
+            jitter = self.jitter * K.diagonal().mean()
+            K = K.clone()
+            K.diagonal().add_(jitter)
+        if torch.jit.is_tracing():
+            # the info check below is a Python branch that would be traced as a constant, let the factorization raise instead
             return torch.linalg.cholesky(K)
-        except RuntimeError as e:
-            print("ERROR:", e.args[0], file=sys.__stdout__)
-            if K.isnan().any():
-                print("ERROR: kernel matrix has NaNs!", file=sys.__stdout__)
-            if K.isinf().any():
-                print("ERROR: kernel matrix has infinities!", file=sys.__stdout__)
-            self.print_parameters()
-            plot_gram(K)
-            raise CholeskyException(e.args[0], K, self)
+
+        # check the info code rather than relying on exception handling for failures
+        L, info = torch.linalg.cholesky_ex(K)
+        if self._cholesky_infos is not None:
+            # within loss() all info codes are checked at once after the backward pass, so that the device is not synchronized per factorization
+            self._cholesky_infos.append((info, K))
+        else:
+            self._check_cholesky(info, K)
+        return L
+
+    def _check_cholesky(self, info, K):
+        info = info.item()
+        if info == 0:
+            return
+
+        message = "linalg.cholesky: The factorization could not be completed because the input is not positive-definite (the leading minor of order %d is not positive-definite)." % (info,)
+        print("ERROR:", message, file=sys.__stdout__)
+        if K.isnan().any():
+            print("ERROR: kernel matrix has NaNs!", file=sys.__stdout__)
+        if K.isinf().any():
+            print("ERROR: kernel matrix has infinities!", file=sys.__stdout__)
+        self.print_parameters()
+        plot_gram(K)
+        raise CholeskyException(message, K, self)
 
     def log_marginal_likelihood(self):
         """
@@ -284,11 +365,19 @@ class Model(torch.nn.Module):
             torch.tensor: Loss.
         """
         self.zero_grad(set_to_none=True)
-        if self._compiled_forward is None:
-            loss = self.forward()
-        else:
-            loss = self._compiled_forward()
-        loss.backward()
+        self._cholesky_infos = []
+        try:
+            if self._compiled_forward is None:
+                loss = self.forward()
+            else:
+                loss = self._compiled_forward()
+            loss.backward()
+
+            if 0 < len(self._cholesky_infos) and torch.stack([info for info, _ in self._cholesky_infos]).any().item():
+                for info, K in self._cholesky_infos:
+                    self._check_cholesky(info, K)
+        finally:
+            self._cholesky_infos = None
         return loss
 
     def K(self, X1, X2=None):
@@ -367,9 +456,11 @@ class Model(torch.nn.Module):
             else:
                 mu, var = self.predict_f(Z, full=True)  # Mx1, MxM
 
-            eye = torch.eye(var.shape[0], device=config.device, dtype=config.dtype)
-            var += self.jitter * var.diagonal().mean() * eye  # MxM
-            samples_f = torch.distributions.multivariate_normal.MultivariateNormal(mu.reshape(-1), var).sample([S])
+            # reparameterize as mu + L.u using our own factorization, MultivariateNormal would factorize var twice to validate it
+            var.diagonal().add_(self.jitter * var.diagonal().mean())  # MxM
+            L = self._cholesky(var)  # MxM
+            u = torch.randn(S, Z.shape[0], device=config.device, dtype=config.dtype)  # SxM
+            samples_f = torch.addmm(mu.reshape(1,-1), u, L.T)  # SxM
 
             if n is None:
                 samples_f = samples_f.squeeze()
@@ -420,7 +511,6 @@ class Exact(Model):
             data_variance = Parameter.to_tensor(data_variance)
             if data_variance.ndim != 1 or X.ndim == 2 and data_variance.shape[0] != X.shape[0]:
                 raise ValueError("data variance must have shape (data_points,)")
-            data_variance = data_variance.diagflat()
         self.data_variance = data_variance
 
         variance = Parameter.to_tensor(variance)
@@ -432,53 +522,63 @@ class Exact(Model):
 
         super().__init__(kernel, X, y, GaussianLikelihood(torch.sqrt(variance)), jitter, mean)
 
-        self.eye = torch.eye(self.X.shape[0], device=config.device, dtype=config.dtype)
         self.log_marginal_likelihood_constant = 0.5*self.X.shape[0]*np.log(2.0*np.pi)
 
-    def log_marginal_likelihood(self):
+    def _factorize(self, y):
+        # factorizations of the training data shared by the log marginal likelihood and the predictions
         Kff = self.kernel.K(self.X)
-        Kff += self._index_channel(self.likelihood.scale().square(), self.X) * self.eye  # NxN
+        Kff.diagonal().add_(self._index_channel(self.likelihood.scale().square(), self.X))  # NxN
         if self.data_variance is not None:
-            Kff += self.data_variance
+            Kff.diagonal().add_(self.data_variance)
+
         L = self._cholesky(Kff, add_jitter=True)  # NxN
+        a = torch.linalg.solve_triangular(L,y,upper=False)  # Nx1
+        return L, a
 
+    def log_marginal_likelihood(self):
         if self.mean is not None:
             y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
         else:
             y = self.y  # Nx1
 
+        L, a = self._factorize(y)
+        self._seed_predict_cache(L, a)
+
         p = -self.log_marginal_likelihood_constant
         p -= L.diagonal().log().sum() # 0.5 is taken inside the log: L is the square root
-        p -= 0.5*y.T.mm(torch.cholesky_solve(y,L)).squeeze()
+        p -= 0.5*a.square().sum()  # y^T K^-1 y = |L^-1 y|^2
         return p
 
     def predict_f(self, X, full=False):
         with torch.inference_mode():
             X = self._check_input(X)  # MxD
-            if self.mean is not None:
-                y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+
+            cache = self._get_predict_cache()
+            if cache is None:
+                # the training data is only needed when factorizing
+                if self.mean is not None:
+                    y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+                else:
+                    y = self.y  # Nx1
+                Lff, a = self._factorize(y)
+                self._set_predict_cache(Lff, a)
             else:
-                y = self.y  # Nx1
+                Lff, a = cache
 
-            Kff = self.kernel.K(self.X)
-            Kff += self._index_channel(self.likelihood.scale().square(), self.X) * self.eye  # NxN
-            if self.data_variance is not None:
-                Kff += self.data_variance
             Kfs = self.kernel.K(self.X,X)  # NxM
-
-            Lff = self._cholesky(Kff, add_jitter=True)  # NxN
             v = torch.linalg.solve_triangular(Lff,Kfs,upper=False)  # NxM
 
-            mu = Kfs.T.mm(torch.cholesky_solve(y,Lff))  # Mx1
             if self.mean is not None:
-                mu += self.mean(X).reshape(-1,1)  # Mx1
+                mu = torch.addmm(self.mean(X).reshape(-1,1), v.T, a)  # Mx1;  add the mean in the same GEMM
+            else:
+                mu = v.T.mm(a)  # Mx1, Kfs^T K^-1 y = (L^-1 Kfs)^T (L^-1 y)
 
             if full:
                 Kss = self.kernel.K(X)  # MxM
-                var = Kss - v.T.mm(v)  # MxM
+                var = torch.addmm(Kss, v.T, v, alpha=-1.0)  # MxM
             else:
                 Kss_diag = self.kernel.K_diag(X)  # M
-                var = Kss_diag - v.T.square().sum(dim=1)  # M
+                var = Kss_diag - v.square_().sum(dim=0)  # M;  v is not needed anymore, square in place
                 var = var.reshape(-1,1)
             return mu, var
 
@@ -507,71 +607,78 @@ class Snelson(Model):
 
         Z = init_inducing_points(Z, self.X, method=Z_init, output_dims=kernel.output_dims)
         Z = self._check_input(Z)
-        
-        self.eye = torch.eye(Z.shape[0], device=config.device, dtype=config.dtype)
+
         self.log_marginal_likelihood_constant = 0.5*self.X.shape[0]*np.log(2.0*np.pi)
         self.Z = Parameter(Z, name="induction_points")
         if kernel.output_dims is not None:
             self.Z.num_parameters -= self.Z().shape[0]
 
-    def log_marginal_likelihood(self):
-        if self.mean is not None:
-            y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
-        else:
-            y = self.y  # Nx1
-
+    def _factorize(self, y, Kuu, Kuf):
+        # factorizations of the training data shared by the log marginal likelihood and the predictions
         Kff_diag = self.kernel.K_diag(self.X)  # N
-        Kuf = self.kernel.K(self.Z(),self.X)  # MxN
-        Kuu = self.kernel.K(self.Z())  # MxM
 
         Luu = self._cholesky(Kuu, add_jitter=True)  # MxM;  Luu = Kuu^(1/2)
         v = torch.linalg.solve_triangular(Luu,Kuf,upper=False)  # MxN;  Kuu^(-1/2).Kuf
         g = Kff_diag - v.T.square().sum(dim=1) + self._index_channel(self.likelihood.scale().square(), self.X)  # N;  diag(Kff-Qff) + sigma^2.I
-        G = torch.diagflat(1.0/g)  # N
-        L = self._cholesky(v.mm(G).mm(v.T) + self.eye)  # MxM;  (Kuu^(-1/2).Kuf.G.Kfu.Kuu^(-1/2) + I)^(1/2)
+        vG = v / g  # MxN;  Kuu^(-1/2).Kuf.G with G = diag(1/g), scales the columns instead of forming the NxN G
+        A = vG.mm(v.T)  # MxM
+        A.diagonal().add_(1.0)
+        L = self._cholesky(A)  # MxM;  (Kuu^(-1/2).Kuf.G.Kfu.Kuu^(-1/2) + I)^(1/2)
 
-        c = torch.linalg.solve_triangular(L,v.mm(G).mm(y),upper=False)  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.G.y
+        c = torch.linalg.solve_triangular(L,vG.mm(y),upper=False)  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.G.y
+        return Luu, L, c, g
+
+    def log_marginal_likelihood(self):
+        if self.mean is not None:
+            y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+        else:
+            y = self.y  # Nx1
+
+        Kuu = self.kernel(self.Z())  # MxM
+        Kuf = self.kernel(self.Z(),self.X)  # MxN
+        Luu, L, c, g = self._factorize(y, Kuu, Kuf)
+        self._seed_predict_cache(Luu, L, c)
 
         p = -self.log_marginal_likelihood_constant
         p -= L.diagonal().log().sum() # 0.5 is taken as the square root of L
         p -= 0.5*g.log().sum()
-        p -= 0.5*y.T.mm(G).mm(y).squeeze()
+        p -= 0.5*(y.squeeze(1).square()/g).sum()
         p += 0.5*c.T.mm(c).squeeze()
         return p
 
     def predict_f(self, X, full=False):
         with torch.inference_mode():
             X = self._check_input(X)  # MxD
-            if self.mean is not None:
-                y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
-            else:
-                y = self.y  # Nx1
-
-            Kff_diag = self.kernel.K_diag(self.X)  # N
-            Kuf = self.kernel.K(self.Z(),self.X)  # MxN
-            Kuu = self.kernel.K(self.Z())  # MxM
-            Kus = self.kernel.K(self.Z(),X)  # MxS
-
-            Luu = self._cholesky(Kuu, add_jitter=True)  # MxM;  Kuu^(1/2)
-            v = torch.linalg.solve_triangular(Luu,Kuf,upper=False)  # MxN;  Kuu^(-1/2).Kuf
-            g = Kff_diag - v.T.square().sum(dim=1) + self._index_channel(self.likelihood.scale().square(), self.X)
-            G = torch.diagflat(1.0/g)  # N
-            L = self._cholesky(v.mm(G).mm(v.T) + self.eye)  # MxM;  (Kuu^(-1/2).Kuf.G.Kfu.Kuu^(-1/2) + I)^(1/2)
 
+            cache = self._get_predict_cache()
+            if cache is None:
+                # the training data is only needed when factorizing
+                if self.mean is not None:
+                    y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+                else:
+                    y = self.y  # Nx1
+                Kuu = self.kernel(self.Z())  # MxM
+                Kuf, Kus = self._K_blocks(self.Z(), self.X, X)  # MxN and MxS
+                Luu, L, c, _ = self._factorize(y, Kuu, Kuf)
+                self._set_predict_cache(Luu, L, c)
+            else:
+                Luu, L, c = cache
+                Kus = self.kernel.K(self.Z(),X)  # MxS
             a = torch.linalg.solve_triangular(Luu,Kus,upper=False)  # NxM
             b = torch.linalg.solve_triangular(L,a,upper=False)
-            c = torch.linalg.solve_triangular(L,v.mm(G).mm(y),upper=False)  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.G.y
 
-            mu = b.T.mm(c)  # Mx1
             if self.mean is not None:
-                mu += self.mean(X).reshape(-1,1)  # Mx1
+                mu = torch.addmm(self.mean(X).reshape(-1,1), b.T, c)  # Mx1;  add the mean in the same GEMM
+            else:
+                mu = b.T.mm(c)  # Mx1
 
             if full:
                 Kss = self.kernel(X)  # MxM
-                var = Kss - a.T.mm(w) + b.T.mm(u)  # MxM
+                var = torch.addmm(Kss, a.T, a, alpha=-1.0)  # MxM;  fused GEMM and subtraction
+                var.addmm_(b.T, b)  # MxM
             else:
                 Kss_diag = self.kernel.K_diag(X)  # M
-                var = Kss_diag - a.T.square().sum(dim=1) + b.T.square().sum(dim=1)  # M
+                var = Kss_diag - a.square_().sum(dim=0) + b.square_().sum(dim=0)  # M;  square in place
                 var = var.reshape(-1,1)
             return mu, var
 
@@ -594,14 +701,14 @@ class OpperArchambeau(Model):
         super().__init__(kernel, X, y, likelihood, jitter, mean)
 
         n = self.X.shape[0]
-        self.eye = torch.eye(n, device=config.device, dtype=config.dtype)
         self.q_nu = Parameter(torch.zeros(n,1))
         self.q_lambda = Parameter(torch.ones(n,1), lower=config.positive_minimum)
         self.likelihood = likelihood
 
     def elbo(self):
         if self.mean is not None:
-            y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+            mean = self.mean(self.X).reshape(-1,1)  # Nx1
+            y = self.y - mean  # Nx1
         else:
             y = self.y  # Nx1
 
@@ -609,20 +716,26 @@ class OpperArchambeau(Model):
         q_lambda = self.q_lambda()
 
         Kff = self.kernel(self.X)  # NxN
-        L = self._cholesky(q_lambda*q_lambda.T*Kff + self.eye)
-        invL = torch.linalg.solve_triangular(L,self.eye,upper=False)  # NxN
+        A = Kff*q_lambda  # NxN
+        A.mul_(q_lambda.T)  # scale the columns in place rather than forming the outer product of q_lambda
+        A.diagonal().add_(1.0)
+        L = self._cholesky(A)
+        eye = torch.eye(L.shape[0], device=config.device, dtype=config.dtype)  # not stored on the model, it is only needed as right-hand side here
+        invL = torch.linalg.solve_triangular(L,eye,upper=False)  # NxN
+        invL2 = invL.square()  # NxN
 
         qf_mu = Kff.mm(q_nu)
-        qf_var_diag = 1.0/q_lambda.square() - (invL.T.mm(invL)/q_lambda/q_lambda.T).diagonal().reshape(-1,1)
+        q_lambda2 = q_lambda.square()
+        qf_var_diag = 1.0/q_lambda2 - invL2.sum(dim=0).reshape(-1,1)/q_lambda2  # diag(invL^T.invL) without the NxN product
 
         kl = q_nu.T.mm(qf_mu).squeeze()  # Mahalanobis
-        kl += L.diagonal().square().log().sum()  # determinant TODO: is this correct?
+        kl += 2.0*L.diagonal().log().sum()  # determinant TODO: is this correct?
         #kl += invL.diagonal().square().sum()  # trace
-        kl += invL.square().sum()  # trace
+        kl += invL2.sum()  # trace
         kl -= q_nu.shape[0]
 
         if self.mean is not None:
-            qf_mu = qf_mu - self.mean(self.X).reshape(-1,1)  # Sx1
+            qf_mu = qf_mu - mean  # Sx1
         var_exp = self.likelihood.variational_expectation(self.X, y, qf_mu, qf_var_diag)
 
         #eye = torch.eye(q_lambda.shape[0], device=config.device, dtype=config.dtype)
@@ -649,19 +762,21 @@ class OpperArchambeau(Model):
             Kff = self.kernel(self.X)
             Kfs = self.kernel(self.X,X)  # NxS
 
-            L = self._cholesky(Kff + (1.0/self.q_lambda().square()).diagflat())  # NxN
+            Kff.diagonal().add_(1.0/self.q_lambda().square().reshape(-1))
+            L = self._cholesky(Kff)  # NxN
             a = torch.linalg.solve_triangular(L,Kfs,upper=False)  # NxS;  Kuu^(-1/2).Kus
 
-            mu = Kfs.T.mm(self.q_nu())  # Sx1
             if self.mean is not None:
-                mu += self.mean(X).reshape(-1,1)  # Sx1
+                mu = torch.addmm(self.mean(X).reshape(-1,1), Kfs.T, self.q_nu())  # Sx1;  add the mean in the same GEMM
+            else:
+                mu = Kfs.T.mm(self.q_nu())  # Sx1
 
             if full:
                 Kss = self.kernel(X)  # SxS
-                var = Kss - a.T.mm(a)  # SxS
+                var = torch.addmm(Kss, a.T, a, alpha=-1.0)  # SxS
             else:
                 Kss_diag = self.kernel.K_diag(X)  # M
-                var = Kss_diag - a.T.square().sum(dim=1)  # M
+                var = Kss_diag - a.square_().sum(dim=0)  # M;  a is not needed anymore, square in place
                 var = var.reshape(-1,1)
             return mu, var
 
@@ -691,12 +806,24 @@ class Titsias(Model):
         Z = init_inducing_points(Z, self.X, method=Z_init, output_dims=kernel.output_dims)
         Z = self._check_input(Z)
 
-        self.eye = torch.eye(Z.shape[0], device=config.device, dtype=config.dtype)
         self.log_marginal_likelihood_constant = 0.5*self.X.shape[0]*np.log(2.0*np.pi)
         self.Z = Parameter(Z, name="induction_points")
         if kernel.output_dims is not None:
             self.Z.num_parameters -= self.Z().shape[0]
 
+    def _factorize(self, y, Kuu, Kuf):
+        # factorizations of the training data shared by the ELBO and the predictions
+        Luu = self._cholesky(Kuu, add_jitter=True)  # MxM;  Kuu^(1/2)
+        v = torch.linalg.solve_triangular(Luu,Kuf,upper=False)  # MxN;  Kuu^(-1/2).Kuf
+        Q = v.mm(v.T)  # MxM;  Kuu^(-1/2).Kuf.Kfu.Kuu^(-1/2)
+        sigma2 = self.likelihood.scale().square()
+        A = Q/sigma2  # MxM
+        A.diagonal().add_(1.0)
+        L = self._cholesky(A)  # MxM;  (Q/sigma^2 + I)^(1/2)
+
+        c = torch.linalg.solve_triangular(L,v.mm(y),upper=False)/sigma2  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.y
+        return Luu, L, c, Q
+
     def elbo(self):
         if self.mean is not None:
             y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
@@ -704,23 +831,18 @@ class Titsias(Model):
             y = self.y  # Nx1
 
         Kff_diag = self.kernel.K_diag(self.X)  # N
-        Kuf = self.kernel(self.Z(),self.X)  # MxN
         Kuu = self.kernel(self.Z())  # MxM
-
-        Luu = self._cholesky(Kuu, add_jitter=True)  # MxM;  Kuu^(1/2)
-        v = torch.linalg.solve_triangular(Luu,Kuf,upper=False)  # MxN;  Kuu^(-1/2).Kuf
-        Q = v.mm(v.T)  # MxM;  Kuu^(-1/2).Kuf.Kfu.Kuu^(-1/2)
-        L = self._cholesky(Q/self.likelihood.scale().square() + self.eye)  # MxM;  (Q/sigma^2 + I)^(1/2)
-
-        c = torch.linalg.solve_triangular(L,v.mm(y),upper=False)/self.likelihood.scale().square()  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.y
+        Kuf = self.kernel(self.Z(),self.X)  # MxN
+        Luu, L, c, Q = self._factorize(y, Kuu, Kuf)
+        self._seed_predict_cache(Luu, L, c)
 
         # p = log N(0, Kfu.Kuu^(-1).Kuf + I/sigma^2) - 1/(2.sigma^2).Trace(Kff - Kfu.Kuu^(-1).Kuf)
+        sigma = self.likelihood.scale()
         p = -self.log_marginal_likelihood_constant
         p -= L.diagonal().log().sum() # 0.5 is taken as the square root of L
-        p -= self.X.shape[0]*self.likelihood.scale().log()
-        p -= 0.5*y.T.mm(y).squeeze()/self.likelihood.scale().square()
+        p -= self.X.shape[0]*sigma.log()
+        p -= 0.5*(y.T.mm(y).squeeze() + Kff_diag.sum() - Q.trace())/sigma.square() # includes trace
         p += 0.5*c.T.mm(c).squeeze()
-        p -= 0.5*(Kff_diag.sum() - Q.trace())/self.likelihood.scale().square() # trace
         return p
 
     def log_marginal_likelihood(self):
@@ -730,37 +852,40 @@ class Titsias(Model):
     def predict_f(self, X, full=False):
         with torch.inference_mode():
             X = self._check_input(X)  # MxD
-            if self.mean is not None:
-                y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
-            else:
-                y = self.y  # Nx1
-
-            Kus = self.kernel(self.Z(),X)  # MxS
-            Kuf = self.kernel(self.Z(),self.X)  # MxN
-            Kuu = self.kernel(self.Z())  # MxM
-
-            Luu = self._cholesky(Kuu, add_jitter=True)  # MxM;  Kuu^(1/2)
-            v = torch.linalg.solve_triangular(Luu,Kuf,upper=False)  # MxN;  Kuu^(-1/2).Kuf
-            L = self._cholesky(v.mm(v.T)/self.likelihood.scale().square() + self.eye)  # MxM;  (Kuu^(-1/2).Kuf.Kfu.Kuu^(-1/2)/sigma^2 + I)^(1/2)
 
+            cache = self._get_predict_cache()
+            if cache is None:
+                # the training data is only needed when factorizing
+                if self.mean is not None:
+                    y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+                else:
+                    y = self.y  # Nx1
+                Kuu = self.kernel(self.Z())  # MxM
+                Kuf, Kus = self._K_blocks(self.Z(), self.X, X)  # MxN and MxS
+                Luu, L, c, _ = self._factorize(y, Kuu, Kuf)
+                self._set_predict_cache(Luu, L, c)
+            else:
+                Luu, L, c = cache
+                Kus = self.kernel(self.Z(),X)  # MxS
             a = torch.linalg.solve_triangular(Luu,Kus,upper=False)  # MxS;  Kuu^(-1/2).Kus
             b = torch.linalg.solve_triangular(L,a,upper=False)  # MxS;  L^(-1).Kuu^(-1/2).Kus
-            c = torch.linalg.solve_triangular(L,v.mm(y),upper=False)/self.likelihood.scale().square()  # Mx1;  L^(-1).Kuu^(-1/2).Kuf.y
 
             # mu = sigma^(-2).Ksu.Kuu^(-1/2).(sigma^(-2).Kuu^(-1/2).Kuf.Kfu.Kuu^(-1/2) + I)^(-1).Kuu^(-1/2).Kuf.y
-            mu = b.T.mm(c)  # Mx1
             if self.mean is not None:
-                mu += self.mean(X).reshape(-1,1)  # Mx1
+                mu = torch.addmm(self.mean(X).reshape(-1,1), b.T, c)  # Mx1;  add the mean in the same GEMM
+            else:
+                mu = b.T.mm(c)  # Mx1
 
             # var = Kss - Qsf.(Qff + sigma^2 I)^(-1).Qfs
             # below is the equivalent but more stable version by using the matrix inversion lemma
             # var = Kss - Ksu.Kuu^(-1).Kus + Ksu.Kuu^(-1/2).(sigma^(-2).Kuu^(-1/2).Kuf.Kfu.Kuu^(-1/2) + I)^(-1).Kuu^(-1/2).Kus
             if full:
                 Kss = self.kernel(X)  # MxM
-                var = Kss - a.T.mm(a) + b.T.mm(b)  # MxM
+                var = torch.addmm(Kss, a.T, a, alpha=-1.0)  # MxM;  fused GEMM and subtraction
+                var.addmm_(b.T, b)  # MxM
             else:
                 Kss_diag = self.kernel.K_diag(X)  # M
-                var = Kss_diag - a.T.square().sum(dim=1) + b.T.square().sum(dim=1)  # M
+                var = Kss_diag - a.square_().sum(dim=0) + b.square_().sum(dim=0)  # M;  square in place
                 var = var.reshape(-1,1)
             return mu, var
 
@@ -793,7 +918,6 @@ class SparseHensman(Model):
             Z = self._check_input(Z)
             n = Z.shape[0]
 
-        self.eye = torch.eye(n, device=config.device, dtype=config.dtype)
         self.log_marginal_likelihood_constant = 0.5*self.X.shape[0]*np.log(2.0*np.pi)
         self.q_mu = Parameter(torch.zeros(n,1))
         self.q_sqrt = Parameter(torch.eye(n))
@@ -806,31 +930,43 @@ class SparseHensman(Model):
             self.Z = Parameter(self.X, train=False)  # don't use inducing points
 
     def kl_gaussian(self, q_mu, q_sqrt):
-        S_diag = q_sqrt.diagonal().square() # NxN
-        kl = q_mu.T.mm(q_mu).squeeze()  # Mahalanobis
-        kl -= S_diag.log().sum()  # determinant of q_var
-        kl += S_diag.sum()  # same as Trace(p_var^(-1).q_var)
+        S_diag = q_sqrt.diagonal().square() # N
+        kl = q_mu.square().sum()  # Mahalanobis
+        kl += (S_diag - S_diag.log()).sum()  # Trace(p_var^(-1).q_var) minus the log determinant of q_var, in one reduction
         kl -= q_mu.shape[0]
         return 0.5*kl
 
     def elbo(self):
         if self.mean is not None:
-            y = self.y - self.mean(self.X).reshape(-1,1)  # Nx1
+            mean = self.mean(self.X).reshape(-1,1)  # Nx1
+            y = self.y - mean  # Nx1
         else:
             y = self.y  # Nx1
 
+        cache = self._reuse_predict_cache()
         if self.is_sparse:
-            qf_mu, qf_var_diag = self._predict_f(self.X, full=False)
+            if cache is None:
+                Kuu = self.kernel(self.Z())  # MxM
+                Luu = self._factorize(Kuu)
+                self._seed_predict_cache(Luu)
+            else:
+                Luu, = cache
+            Kuf = self.kernel(self.Z(),self.X)  # MxN
+            qf_mu, qf_var_diag = self._predict_f(self.X, Luu, Kuf, full=False)
         else:
-            Kff = self.kernel(self.X)
-            Lff = self._cholesky(Kff, add_jitter=True)  # NxN
+            if cache is None:
+                Kff = self.kernel(self.X)
+                Lff = self._cholesky(Kff, add_jitter=True)  # NxN
+                self._seed_predict_cache(Lff)  # Z equals X, so this is also the factorization of Kuu
+            else:
+                Lff, = cache
 
             qf_mu = Lff.mm(self.q_mu())
             if self.mean is not None:
-                qf_mu -= self.mean(self.X).reshape(-1,1)  # Sx1
+                qf_mu -= mean  # Sx1
 
             qf_sqrt = Lff.mm(self.q_sqrt().tril())
-            qf_var_diag = qf_sqrt.mm(qf_sqrt.T).diagonal().reshape(-1,1)
+            qf_var_diag = qf_sqrt.square().sum(dim=1, keepdim=True)  # diag(qf_sqrt.qf_sqrt^T) without the NxN product
 
         var_exp = self.likelihood.variational_expectation(self.X, y, qf_mu, qf_var_diag)
         kl = self.kl_gaussian(self.q_mu(), self.q_sqrt())
@@ -840,18 +976,20 @@ class SparseHensman(Model):
         # maximize the lower bound
         return self.elbo()
 
-    def _predict_f(self, X, full=False):
-        Kuu = self.kernel(self.Z())
-        Kus = self.kernel(self.Z(),X)  # NxS
+    def _factorize(self, Kuu):
+        # factorization of the inducing points shared by the ELBO and the predictions
+        return self._cholesky(Kuu, add_jitter=True)  # NxN
+
+    def _predict_f(self, X, Luu, Kus, full=False):
 
-        Luu = self._cholesky(Kuu, add_jitter=True)  # NxN
         a = torch.linalg.solve_triangular(Luu,Kus,upper=False)  # NxS;  Kuu^(-1/2).Kus
-        b = self.q_sqrt().tril().T.mm(torch.linalg.solve_triangular(Luu,Kus,upper=False))
+        b = self.q_sqrt().tril().T.mm(a)  # NxS
 
-        mu = Kus.T.mm(torch.linalg.solve_triangular(Luu.T,self.q_mu(),upper=True))  # Sx1
+        mu = a.T.mm(self.q_mu())  # Sx1;  Ksu.Kuu^(-T/2).q_mu reusing a
         if full:
             Kss = self.kernel(X)  # SxS
-            var = Kss - a.T.mm(a) + b.T.mm(b)  # SxS
+            var = torch.addmm(Kss, a.T, a, alpha=-1.0)  # SxS;  fused GEMM and subtraction
+            var.addmm_(b.T, b)  # SxS
         else:
             Kss_diag = self.kernel.K_diag(X)  # M
             var = Kss_diag - a.T.square().sum(dim=1) + b.T.square().sum(dim=1)  # M
@@ -862,7 +1000,27 @@ class SparseHensman(Model):
         with torch.inference_mode():
             X = self._check_input(X)  # MxD
 
-            mu, var = self._predict_f(X, full=full)
+            # predict the diagonal variances in chunks to bound the memory of the NxS intermediates
+            chunks = [X] if full else X.split(config.prediction_chunk_size)
+
+            cache = self._get_predict_cache()
+            if cache is None:
+                Kuu = self.kernel(self.Z())  # NxN
+                Luu = self._factorize(Kuu)
+                self._set_predict_cache(Luu)
+            else:
+                Luu, = cache
+            Kus = self.kernel(self.Z(),chunks[0])  # NxS
+
+            mu, var = self._predict_f(chunks[0], Luu, Kus, full=full)
+            if 1 < len(chunks):
+                mu, var = [mu], [var]
+                for x in chunks[1:]:
+                    Kus = self.kernel(self.Z(),x)  # NxS
+                    mu_x, var_x = self._predict_f(x, Luu, Kus)
+                    mu.append(mu_x)
+                    var.append(var_x)
+                mu, var = torch.cat(mu, dim=0), torch.cat(var, dim=0)
             if self.mean is not None:
                 mu += self.mean(X).reshape(-1,1)  # Mx1
             return mu, var
@@ -1,11 +1,6 @@
-import inspect
 import torch
 
 from .config import *
-from .parameter import Parameter
-from .model import Mean
-from .kernel import Kernel
-from .likelihood import Likelihood
 
 def merge_data(xs, ys=None):
     if not isinstance(xs, list) or ys is not None and not isinstance(ys, list):
@@ -91,7 +91,7 @@ def BNSE(x, y, y_err=None, max_freq=None, n=1000, iters=100, jit=True):
 
     with torch.inference_mode():
         Ktt = kernel(x)
-        Ktt += model.likelihood.scale().square() * torch.eye(x.shape[0], device=gpr.config.device, dtype=gpr.config.dtype)
+        Ktt.diagonal().add_(model.likelihood.scale().square())
         Ltt = model._cholesky(Ktt, add_jitter=True)
 
         Kff = kernel_ff(w, w, kernel.magnitude(), kernel.mean(), kernel.variance(), alpha)
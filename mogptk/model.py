@@ -13,6 +13,7 @@ from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 from . import gpr
 from .dataset import DataSet
+from .data import _argsort
 from .util import *
 
 logger = logging.getLogger('mogptk')
@@ -206,12 +207,11 @@ class Model:
             raise ValueError("all data channels must have unique names")
 
         #for j, channel in enumerate(dataset):
-        #    for dim in range(channel.get_input_dims()):
-        #        xran = np.max(channel.X[:,dim]) - np.min(channel.X[:,dim])
-        #        if xran < 1e-3:
-        #            logger.warning("Very small X range may give problems, it is suggested to scale up your X axis for channel %d" % j)
-        #        elif 1e4 < xran:
-        #            logger.warning("Very large X range may give problems, it is suggested to scale down your X axis for channel %d" % j)
+        #    xran = np.ptp(channel.X, axis=0)
+        #    if np.any(xran < 1e-3):
+        #        logger.warning("Very small X range may give problems, it is suggested to scale up your X axis for channel %d" % j)
+        #    elif np.any(1e4 < xran):
+        #        logger.warning("Very large X range may give problems, it is suggested to scale down your X axis for channel %d" % j)
 
         self.name = name
         self.dataset = dataset
@@ -345,7 +345,8 @@ class Model:
         Examples:
             >>> model.log_marginal_likelihood()
         """
-        return float(self.gpr.log_marginal_likelihood())
+        with torch.no_grad():
+            return float(self.gpr.log_marginal_likelihood())
 
     def BIC(self):
         """
@@ -412,12 +413,10 @@ class Model:
         y_pred = y_pred.cpu().numpy()
 
         # transform to original
-        i = 0
-        Y_pred = []
+        idx = np.cumsum([X[j].shape[0] for j in range(self.dataset.get_output_dims())])[:-1]
+        Y_pred = np.split(y_pred.reshape(-1), idx)
         for j in range(self.dataset.get_output_dims()):
-            N = X[j].shape[0]
-            Y_pred.append(self.dataset[j].Y_transformer.backward(np.squeeze(y_pred[i:i+N]), X[j]))
-            i += N
+            Y_pred[j] = self.dataset[j].Y_transformer.backward(Y_pred[j], X[j])
 
         # flatten
         y_true = np.concatenate(Y_true)
@@ -591,11 +590,13 @@ class Model:
             numpy.ndarray: Y data of shape (data_points,1).
             numpy.ndarray: Original but normalized X data. Only if no Y is passed.
         """
-        x = np.concatenate(X, axis=0)
         if self.is_multioutput:
-            chan = [j * np.ones(len(X[j])) for j in range(len(X))]
-            chan = np.concatenate(chan).reshape(-1, 1)
-            x = np.concatenate([chan, x], axis=1)
+            # write channel indices and inputs into a single allocation
+            x = np.empty((sum(len(x) for x in X), X[0].shape[1]+1))
+            x[:,0] = np.repeat(np.arange(len(X)), [len(x) for x in X])
+            np.concatenate(X, axis=0, out=x[:,1:])
+        else:
+            x = np.concatenate(X, axis=0)
         if Y is None:
             return x
 
@@ -638,20 +639,14 @@ class Model:
             ci = [max(0.0, ci[0]), min(1.0, ci[1])]
 
         mu, lower, upper = self.gpr.predict_y(x, ci, sigma=sigma, n=n)
-        mu = mu.cpu().numpy()
-        lower = lower.cpu().numpy()
-        upper = upper.cpu().numpy()
-
-        i = 0
-        Mu = []
-        Lower = []
-        Upper = []
-        for j in range(self.dataset.get_output_dims()):
-            N = X[j].shape[0]
-            Mu.append(np.squeeze(mu[i:i+N]))
-            Lower.append(np.squeeze(lower[i:i+N]))
-            Upper.append(np.squeeze(upper[i:i+N]))
-            i += N
+        # transfer to the host in a single copy and synchronization rather than one per array
+        mu, lower, upper = torch.cat([mu.reshape(1,-1), lower.reshape(1,-1), upper.reshape(1,-1)], dim=0).cpu().numpy()
+
+        # split the stacked predictions into per-channel views
+        idx = np.cumsum([X[j].shape[0] for j in range(self.dataset.get_output_dims())])[:-1]
+        Mu = np.split(mu.reshape(-1), idx)
+        Lower = np.split(lower.reshape(-1), idx)
+        Upper = np.split(upper.reshape(-1), idx)
 
         if not transformed:
             for j in range(self.dataset.get_output_dims()):
@@ -713,22 +708,19 @@ class Model:
         samples = self.gpr.sample_y(Z=x, n=n)
         samples = samples.cpu().numpy()
 
-        i = 0
-        Samples = []
-        for j in range(self.dataset.get_output_dims()):
-            N = X[j].shape[0]
-            if n is None:
-                sample = np.squeeze(samples[i:i+N])
-                if not transformed:
-                    sample = self.dataset[j].Y_transformer.backward(sample, X[j])
-                Samples.append(sample)
-            else:
-                sample = samples[i:i+N,:]
-                for k in range(n):
-                    if not transformed:
-                        sample[:,k] = self.dataset[j].Y_transformer.backward(sample[:,k], X[j])
-                Samples.append(sample)
-            i += N
+        idx = np.cumsum([X[j].shape[0] for j in range(self.dataset.get_output_dims())])[:-1]
+        if n is None:
+            samples = samples.reshape(-1)
+        else:
+            samples = samples.T  # nxN => Nxn
+        Samples = np.split(samples, idx)
+        if not transformed:
+            for j in range(self.dataset.get_output_dims()):
+                if n is None:
+                    Samples[j] = self.dataset[j].Y_transformer.backward(Samples[j], X[j])
+                else:
+                    for k in range(n):
+                        Samples[j][:,k] = self.dataset[j].Y_transformer.backward(Samples[j][:,k], X[j])
         if self.dataset.get_output_dims() == 1:
             return Samples[0]
         return Samples
@@ -831,7 +823,7 @@ class Model:
                 ax[j,0].errorbar(x, y, [y-yl, yu-y], elinewidth=1.5, ecolor='lightgray', capsize=0, ls='', marker='')
 
             # prediction
-            idx = np.argsort(X[j][:,0])
+            idx = _argsort(X[j][:,0])
             x = X[j][idx,0].astype(data.X_dtypes[0])
             ax[j,0].plot(x, Mu[j][idx], ls=':', color='blue', lw=2)
             if not np.all(Lower[j][idx] == Mu[j][idx]) and not np.all(Upper[j][idx] == Mu[j][idx]):
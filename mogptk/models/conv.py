@@ -50,10 +50,12 @@ class CONV(Model):
 
         conv = GaussianConvolutionProcessKernel(output_dims=output_dims, input_dims=input_dims)
         kernel = MixtureKernel(conv, Q)
+        n = output_dims*input_dims
+        init = torch.rand(Q, output_dims+n+input_dims)  # draw for all components at once, in the same order as drawing per component
         for q in range(Q):
-            kernel[q].weight.assign(torch.rand(output_dims))
-            kernel[q].variance.assign(torch.rand(output_dims,input_dims))
-            kernel[q].base_variance.assign(torch.rand(input_dims))
+            kernel[q].weight.assign(init[q,:output_dims])
+            kernel[q].variance.assign(init[q,output_dims:output_dims+n].reshape(output_dims,input_dims))
+            kernel[q].base_variance.assign(init[q,output_dims+n:])
 
         super().__init__(dataset, kernel, inference, mean, name)
         self.Q = Q
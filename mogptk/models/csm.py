@@ -51,10 +51,11 @@ class CSM(Model):
 
         spectral = CrossSpectralKernel(output_dims=output_dims, input_dims=input_dims, Rq=Rq)
         kernel = MixtureKernel(spectral, Q)
+        init = torch.rand(Q, output_dims*Rq+2*input_dims)  # draw for all components at once, in the same order as drawing per component
         for q in range(Q):
-            kernel[q].amplitude.assign(torch.rand(output_dims,Rq))
-            kernel[q].mean.assign(torch.rand(input_dims))
-            kernel[q].variance.assign(torch.rand(input_dims))
+            kernel[q].amplitude.assign(init[q,:output_dims*Rq].reshape(output_dims,Rq))
+            kernel[q].mean.assign(init[q,output_dims*Rq:output_dims*Rq+input_dims])
+            kernel[q].variance.assign(init[q,output_dims*Rq+input_dims:])
 
         super().__init__(dataset, kernel, inference, mean, name)
         self.Q = Q
@@ -90,13 +91,11 @@ class CSM(Model):
             logger.warning('{} could not find peaks for MOSM'.format(method))
             return
 
-        output_dims = self.dataset.get_output_dims()
         means = np.concatenate(means, axis=0)
         variances = np.concatenate(variances, axis=0)
-        constant = torch.rand(output_dims, self.Q, self.Rq)
+        constant = np.stack([amplitude.mean(axis=1)**2 for amplitude in amplitudes]) / self.Rq  # output_dims x Q
+        constant = np.repeat(constant[:,:,None], self.Rq, axis=2)  # output_dims x Q x Rq
         for q in range(self.Q):
-            for j in range(len(self.dataset)):
-                constant[j,q,:] = amplitudes[j][q,:].mean()**2 / self.Rq
             self.gpr.kernel[q].amplitude.assign(constant[:,q,:])
             self.gpr.kernel[q].mean.assign(means[q,:])
             self.gpr.kernel[q].variance.assign(variances[q,:])
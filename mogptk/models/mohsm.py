@@ -50,12 +50,14 @@ class MOHSM(Model):
 
         spectral = MultiOutputHarmonizableSpectralKernel(output_dims=output_dims, input_dims=input_dims)
         kernel = MixtureKernel(spectral, P*Q)  # TODO: P>1 not supported
+        n = output_dims*input_dims
+        init = torch.rand(P*Q, 2*output_dims+2*n)  # draw for all components at once, in the same order as drawing per component
         for p in range(P):
             for q in range(Q):
-                kernel[p*Q+q].weight.assign(torch.rand(output_dims))
-                kernel[p*Q+q].mean.assign(torch.rand(output_dims,input_dims))
-                kernel[p*Q+q].variance.assign(torch.rand(output_dims,input_dims))
-                kernel[p*Q+q].lengthscale.assign(torch.rand(output_dims))
+                kernel[p*Q+q].weight.assign(init[p*Q+q,:output_dims])
+                kernel[p*Q+q].mean.assign(init[p*Q+q,output_dims:output_dims+n].reshape(output_dims,input_dims))
+                kernel[p*Q+q].variance.assign(init[p*Q+q,output_dims+n:output_dims+2*n].reshape(output_dims,input_dims))
+                kernel[p*Q+q].lengthscale.assign(init[p*Q+q,output_dims+2*n:])
         
         super().__init__(dataset, kernel, inference, mean, name)
         self.Q = Q
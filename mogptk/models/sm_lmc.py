@@ -53,10 +53,11 @@ class SM_LMC(Model):
         spectral = [SpectralKernel(input_dims) for q in range(Q)]
         kernel = LinearModelOfCoregionalizationKernel(spectral, output_dims=output_dims, input_dims=input_dims, Q=Q, Rq=Rq)
         kernel.weight.assign(torch.rand(output_dims,Q,Rq))
+        init = torch.rand(Q, 1+2*input_dims)  # draw for all components at once, in the same order as drawing per component
         for q in range(Q):
-            kernel[q].magnitude.assign(torch.rand(1))
-            kernel[q].mean.assign(torch.rand(input_dims))
-            kernel[q].variance.assign(torch.rand(input_dims))
+            kernel[q].magnitude.assign(init[q,:1])
+            kernel[q].mean.assign(init[q,1:1+input_dims])
+            kernel[q].variance.assign(init[q,1+input_dims:])
 
         super().__init__(dataset, kernel, inference, mean, name)
         self.Q = Q
@@ -93,13 +94,11 @@ class SM_LMC(Model):
             logger.warning('{} could not find peaks for SM-LMC'.format(method))
             return
 
-        output_dims = self.dataset.get_output_dims()
         means = np.concatenate(means, axis=0)
         variances = np.concatenate(variances, axis=0)
-        constant = torch.rand(output_dims, self.Q, self.Rq)
+        constant = np.stack([amplitude.mean(axis=1) for amplitude in amplitudes]) / self.Rq  # output_dims x Q
+        constant = np.repeat(constant[:,:,None], self.Rq, axis=2)  # output_dims x Q x Rq
         for q in range(self.Q):
-            for j in range(len(self.dataset)):
-                constant[j,q,:] = amplitudes[j][q,:].mean() / self.Rq
             self.gpr.kernel[q].mean.assign(means[q,:])
             self.gpr.kernel[q].variance.assign(variances[q,:])
         self.gpr.kernel.weight.assign(constant)
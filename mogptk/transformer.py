@@ -1,6 +1,14 @@
 import copy
 import numpy as np
 
+def _polyval(coef, x):
+    # Horner's method with in-place updates, np.polyval allocates two temporaries per coefficient
+    y = np.full(x.shape, coef[0], dtype=np.float64)
+    for c in coef[1:]:
+        y *= x
+        y += c
+    return y
+
 class Transformer:
     def __init__(self, transformers=None):
         if transformers is None:
@@ -61,19 +69,19 @@ class TransformDetrend(TransformBase):
         return 'TransformDetrend(degree=%g)' % (self.degree,)
 
     def set_data(self, y, x=None):
-        self.coef = np.polyfit(x[:,self.dim], y, self.degree)
+        self.coef = np.ascontiguousarray(np.polyfit(x[:,self.dim], y, self.degree), dtype=np.float64)
 
     def forward(self, y, x):
         if x is None:
             raise ValueError("must set X for transformation")
         x = x[:,self.dim]
-        return y - np.polyval(self.coef, x)
+        return y - _polyval(self.coef, x)
     
     def backward(self, y, x):
         if x is None:
             raise ValueError("must set X for transformation")
         x = x[:,self.dim]
-        return y + np.polyval(self.coef, x)
+        return y + _polyval(self.coef, x)
 
 class TransformLinear(TransformBase):
     """
@@ -106,11 +114,19 @@ class TransformNormalize(TransformBase):
         self.ymin = np.amin(y)
         self.ymax = np.amax(y)
 
+        # fold the affine map into a single scale and offset
+        self._scale = 2.0/(self.ymax-self.ymin)
+        self._offset = -1.0 - self.ymin*self._scale
+
     def forward(self, y, x=None):
-        return -1.0 + 2.0*(y-self.ymin)/(self.ymax-self.ymin)
+        out = np.multiply(y, self._scale)
+        out += self._offset
+        return out
     
     def backward(self, y, x=None):
-        return (y+1.0)/2.0*(self.ymax-self.ymin)+self.ymin
+        out = np.multiply(y, 0.5*(self.ymax-self.ymin))
+        out += 0.5*(self.ymax+self.ymin)
+        return out
 
 class TransformLog(TransformBase):
     """
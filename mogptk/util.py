@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.stats import norm
 
 def mean_absolute_error(y_true, y_pred):
     """
@@ -131,6 +130,8 @@ def plot_spectrum(means, scales, dataset=None, weights=None, noises=None, method
     """
     Plot spectral Gaussians of given means, scales and weights.
     """
+    from scipy.stats import norm  # scipy.stats is slow to import
+
     means = np.array(means)
     if means.ndim == 2:
         means = np.expand_dims(means, axis=2)
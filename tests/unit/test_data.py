@@ -0,0 +1,82 @@
+import unittest
+import mogptk
+import numpy as np
+import pandas as pd
+import datetime
+import os
+import tempfile
+import unittest.mock
+
+class TestData(unittest.TestCase):
+    def test_datetime_objects(self):
+        X = np.array([datetime.datetime(2020,1,1), datetime.datetime(2020,1,3)], dtype=object)
+        data = mogptk.Data(X, [1.0, 2.0])
+        self.assertEqual(data.X_dtypes[0], np.dtype('datetime64[D]'))
+        self.assertTrue(np.array_equal(data.X[:,0], [18262.0, 18264.0]))
+
+    def test_numeric_objects(self):
+        # numbers must not be parsed as nanoseconds since the epoch
+        with self.assertRaises(ValueError):
+            mogptk.Data(np.array([1.0, 2.0], dtype=object), [1.0, 2.0])
+
+        df = pd.DataFrame({'x': pd.Series([1, 2, 3, 4], dtype=object), 'y': [1.0, 2.0, 3.0, 4.0]})
+        with self.assertRaises(ValueError):
+            mogptk.LoadDataFrame(df, 'x', 'y')
+
+    def test_timezone_objects(self):
+        # timezone-aware dates are converted to UTC
+        X = np.array([pd.Timestamp('2020-01-01 14:00', tz='Europe/Amsterdam'), pd.Timestamp('2020-01-02', tz='Europe/Amsterdam')], dtype=object)
+        data = mogptk.Data(X, [1.0, 2.0])
+        self.assertEqual(data.X_dtypes[0], np.dtype('datetime64[h]'))
+        self.assertTrue(np.array_equal(data.X[:,0], [438301.0, 438311.0]))
+
+        tz = datetime.timezone(datetime.timedelta(hours=2))
+        X = np.array([datetime.datetime(2020,1,1,tzinfo=datetime.timezone.utc), datetime.datetime(2020,1,1,5,tzinfo=tz)], dtype=object)
+        data = mogptk.Data(X, [1.0, 2.0])
+        self.assertTrue(np.array_equal(data.X[:,0], [438288.0, 438291.0]))
+
+    def test_ls_estimation(self):
+        # every input dimension uses a grid of n frequencies
+        x = np.linspace(0.0, 10.0, 200)
+        data = mogptk.Data(np.stack([x, x], axis=1), np.sin(2.0*np.pi*0.7*x))
+        A, B, C = data.get_ls_estimation(Q=1, n=1000)
+        self.assertEqual(B.shape, (1,2))
+        self.assertTrue(np.allclose(B[:,0], B[:,1]))
+        self.assertAlmostEqual(B[0,0], 0.7, places=2)
+
+    def test_load_csv_dates(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, 'data.csv')
+            pd.DataFrame({'date': ['2020-01-01', '2020-01-02', '2020-01-04'], 'y': [1.0, 2.0, 3.0]}).to_csv(filename, index=False)
+            for engine in [None, 'c', 'python']:
+                with self.subTest(engine=engine):
+                    kwargs = {} if engine is None else {'engine': engine}
+                    data = mogptk.LoadCSV(filename, 'date', 'y', **kwargs)
+                    self.assertEqual(data.X_dtypes[0], np.dtype('datetime64[D]'))
+                    self.assertTrue(np.array_equal(data.X[:,0], [18262.0, 18263.0, 18265.0]))
+
+    def test_load_csv_engine(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, 'data.csv')
+            with open(filename, 'w') as f:
+                f.write('x,y\n1,2\n3,4\n# footer\n')
+
+            # options not supported by the pyarrow engine use the default engine
+            with unittest.mock.patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+                data = mogptk.LoadCSV(filename, 'x', 'y', comment='#')
+                self.assertNotIn('engine', read_csv.call_args.kwargs)
+            self.assertTrue(np.array_equal(data.X[:,0], [1.0, 3.0]))
+
+            # parse errors are raised, the file is not read again with another engine
+            with open(filename, 'w') as f:
+                f.write('x,y\n1,2\n3,4,5\n')
+            with unittest.mock.patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+                with self.assertRaises(ValueError):
+                    mogptk.LoadCSV(filename, 'x', 'y')
+                self.assertEqual(read_csv.call_count, 1)
+                if mogptk.dataset._has_pyarrow:
+                    self.assertEqual(read_csv.call_args.kwargs['engine'], 'pyarrow')
+
+if __name__ == '__main__':
+    unittest.main()
+
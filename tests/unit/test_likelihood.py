@@ -0,0 +1,28 @@
+import unittest
+import mogptk
+import torch
+
+device = mogptk.gpr.config.device
+dtype = mogptk.gpr.config.dtype
+
+class TestLikelihood(unittest.TestCase):
+    def test_gaussian_predict(self):
+        # the multi-output intervals must match the single-output intervals of each channel
+        torch.manual_seed(0)
+        X = torch.tensor([[0.0, 0.0], [1.0, 0.5], [0.0, 1.0], [1.0, 1.5], [1.0, 2.0]], device=device, dtype=dtype)
+        mu = torch.randn(5, 1, device=device, dtype=dtype)
+        var = torch.rand(5, 1, device=device, dtype=dtype)
+        scales = [0.5, 2.0]
+
+        likelihood = mogptk.gpr.GaussianLikelihood(torch.tensor(scales, device=device, dtype=dtype))
+        for kwargs in [{'ci': [0.025, 0.975]}, {'sigma': 2.0}]:
+            with self.subTest(**kwargs):
+                _, lower, upper = likelihood.predict(X, mu, var.clone(), **kwargs)
+                for i, scale in enumerate(scales):
+                    r = X[:,0] == i
+                    _, lower_i, upper_i = mogptk.gpr.GaussianLikelihood(scale).predict(X[r,1:], mu[r], var[r].clone(), **kwargs)
+                    self.assertTrue(torch.allclose(lower[r], lower_i))
+                    self.assertTrue(torch.allclose(upper[r], upper_i))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+import mogptk
+import numpy as np
+import torch
+
+class TestModel(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        torch.manual_seed(0)
+        x = np.linspace(0.0, 10.0, 30)
+        self.data = mogptk.Data(x, np.sin(x) + x, name='A')
+        self.data.transform(mogptk.TransformDetrend())  # the backward transform depends on X
+
+    def test_sample_shape(self):
+        model = mogptk.SM(self.data, Q=1)
+        X = np.linspace(0.0, 10.0, 7)
+        for transformed in [True, False]:
+            with self.subTest(transformed=transformed):
+                samples = model.sample(X, n=5, transformed=transformed)
+                self.assertEqual(samples.shape, (7,5))
+                samples = model.sample(X, transformed=transformed)
+                self.assertEqual(samples.shape, (7,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import mogptk
+import torch
+
+device = mogptk.gpr.config.device
+dtype = mogptk.gpr.config.dtype
+
+class TestSparse(unittest.TestCase):
+    def setUp(self):
+        torch.manual_seed(0)
+        self.X = torch.linspace(0.0, 5.0, 40, device=device, dtype=dtype).reshape(-1,1)
+        self.y = torch.sin(self.X).reshape(-1) + 0.1*torch.randn(40, device=device, dtype=dtype)
+        self.Z = self.X[::4]
+        self.Xs = torch.linspace(0.0, 6.0, 17, device=device, dtype=dtype).reshape(-1,1)
+
+    def test_full_covariance(self):
+        m = mogptk.gpr.Snelson(mogptk.gpr.SquaredExponentialKernel(), self.X, self.y, Z=self.Z)
+        mu, var = m.predict_f(self.Xs, full=True)
+        mu_diag, var_diag = m.predict_f(self.Xs)
+        self.assertEqual(var.shape, (17,17))
+        self.assertTrue(torch.allclose(mu, mu_diag))
+        self.assertTrue(torch.allclose(var.diagonal(), var_diag.reshape(-1)))
+
+    def test_white_kernel(self):
+        # the WhiteKernel only adds its diagonal for K(X), not for K(X,X), so Kuu must be evaluated by itself
+        for model in [mogptk.gpr.Snelson, mogptk.gpr.Titsias]:
+            with self.subTest(model.__name__):
+                kernel = mogptk.gpr.AddKernel(mogptk.gpr.SquaredExponentialKernel(), mogptk.gpr.WhiteKernel())
+                m = model(kernel, self.X, self.y, Z=self.Z)
+                params = [p for p in m.parameters() if p.requires_grad]
+
+                Z, y = m.Z(), self.y.reshape(-1,1)
+                Kuu = kernel(Z)
+                Kuf = kernel(Z, self.X)
+                Kff = kernel(self.X)
+                Qff = Kuf.T.mm(torch.linalg.solve(Kuu, Kuf))
+                sigma2 = m.likelihood.scale().square()
+                if model is mogptk.gpr.Snelson:
+                    g = (Kff - Qff).diagonal() + sigma2  # FITC
+                else:
+                    g = sigma2.expand(40)
+                lml = torch.distributions.MultivariateNormal(torch.zeros(40, device=device, dtype=dtype), Qff + torch.diag(g)).log_prob(self.y)
+                if model is mogptk.gpr.Titsias:
+                    lml = lml - (Kff - Qff).diagonal().sum()/(2.0*sigma2)
+
+                p = m.log_marginal_likelihood()
+                self.assertTrue(torch.allclose(p, lml))
+                for a, b in zip(torch.autograd.grad(p, params), torch.autograd.grad(lml, params)):
+                    self.assertTrue(torch.allclose(a, b))
+
+                with torch.no_grad():
+                    Kus = kernel(Z, self.Xs)
+                    Sigma = Kuu + Kuf.mm(Kuf.T/g.reshape(-1,1))
+                    mu_ref = Kus.T.mm(torch.linalg.solve(Sigma, Kuf.mm(y/g.reshape(-1,1))))
+                    var_ref = kernel(self.Xs) - Kus.T.mm(torch.linalg.solve(Kuu, Kus)) + Kus.T.mm(torch.linalg.solve(Sigma, Kus))
+                mu, var = m.predict_f(self.Xs, full=True)
+                self.assertTrue(torch.allclose(mu, mu_ref))
+                self.assertTrue(torch.allclose(var, var_ref))
+
+        kernel = mogptk.gpr.AddKernel(mogptk.gpr.SquaredExponentialKernel(), mogptk.gpr.WhiteKernel())
+        m = mogptk.gpr.SparseHensman(kernel, self.X, self.y, Z=self.Z)
+        m.q_mu.assign(torch.randn(10, 1, device=device, dtype=dtype))
+        m.q_sqrt.assign(torch.eye(10, device=device, dtype=dtype) + 0.1*torch.randn(10, 10, device=device, dtype=dtype).tril())
+        with torch.no_grad():
+            Z = m.Z()
+            Luu = torch.linalg.cholesky(kernel(Z))
+            a = torch.linalg.solve_triangular(Luu, kernel(Z, self.Xs), upper=False)
+            b = m.q_sqrt().tril().T.mm(a)
+            mu_ref = a.T.mm(m.q_mu())
+            var_ref = kernel(self.Xs) - a.T.mm(a) + b.T.mm(b)
+        mu, var = m.predict_f(self.Xs, full=True)
+        self.assertTrue(torch.allclose(mu, mu_ref))
+        self.assertTrue(torch.allclose(var, var_ref))
+
+if __name__ == '__main__':
+    unittest.main()
+